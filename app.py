@@ -7,31 +7,64 @@ Rotates through configured data providers, rendering bitmaps and posting to trix
 """
 
 import argparse
+import logging
+import os
 import signal
 import sys
 from datetime import datetime
+from types import SimpleNamespace
 
-from trixhub.config import get_config
-from trixhub.schedulers import get_scheduler
 
+# Module state shared with the signal handler (the running scheduler)
+_state = SimpleNamespace(scheduler=None)
 
-# Global scheduler instance for signal handler
-scheduler = None
+SEPARATOR = "=" * 70
+
+# Timeout for the clear request sent on shutdown; trix-server being down is a
+# common reason we're stopped, and a long wait would stall the container stop
+SHUTDOWN_CLEAR_TIMEOUT = 0.5
+
+
+# Command line parser, built once at import
+_PARSER = argparse.ArgumentParser(
+    description="trix-hub - LED Matrix Data Aggregation Hub",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog="""
+Examples:
+  python app.py              Run in normal mode (post bitmaps to matrix)
+  python app.py --debug      Run in debug mode (print ASCII to console)
+    """
+)
+_PARSER.add_argument(
+    "--debug",
+    action="store_true",
+    help="Debug mode: render ASCII to console instead of posting bitmaps"
+)
+_PARSER.add_argument(
+    "--quiet",
+    action="store_true",
+    help="Quiet mode: minimal logging output to reduce SD card wear"
+)
 
 
 def signal_handler(signum, frame):
     """Handle shutdown signals - exit immediately."""
-    global scheduler
+    scheduler = _state.scheduler
+    timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
     print()
-    print("=" * 70)
-    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Shutdown requested with signum {signum}...")
-    print("=" * 70)
+    print(SEPARATOR)
+    print(f"[{timestamp}] Shutdown requested with signum {signum}...")
+    print(SEPARATOR)
+
+    # Stop background prefetches so nothing queued starts during exit
+    if scheduler is not None:
+        scheduler.close()
 
     # Clear display on shutdown
-    if scheduler and scheduler.client and not scheduler.debug:
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Attempting to clear display...")
-        scheduler.client.clear_display()
+    if scheduler is not None and scheduler.client and not scheduler.debug:
+        print(f"[{timestamp}] Attempting to clear display...")
+        scheduler.client.clear_display(timeout=SHUTDOWN_CLEAR_TIMEOUT)
 
     # Exit immediately - don't wait for graceful shutdown
     sys.exit(0)
@@ -39,29 +72,21 @@ def signal_handler(signum, frame):
 
 def main():
     """Main entry point."""
-    global scheduler
-
     # Parse command line arguments
-    parser = argparse.ArgumentParser(
-        description="trix-hub - LED Matrix Data Aggregation Hub",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  python app.py              Run in normal mode (post bitmaps to matrix)
-  python app.py --debug      Run in debug mode (print ASCII to console)
-        """
-    )
-    parser.add_argument(
-        "--debug",
-        action="store_true",
-        help="Debug mode: render ASCII to console instead of posting bitmaps"
-    )
-    parser.add_argument(
-        "--quiet",
-        action="store_true",
-        help="Quiet mode: minimal logging output to reduce SD card wear"
-    )
-    args = parser.parse_args()
+    args = _PARSER.parse_args()
+
+    # Library modules log through `logging`; print their messages plainly
+    # alongside the scheduler's own output
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
+    # Prefer the native upb protobuf backend for realtime feed parsing; an
+    # explicit setting in the environment still wins. Must precede any
+    # protobuf import, so it's set before trixhub is loaded.
+    os.environ.setdefault('PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION', 'upb')
+
+    # Imported after parsing so --help doesn't pay for PIL/numpy/pandas imports
+    from trixhub.config import get_config
+    from trixhub.schedulers import get_scheduler
 
     # Register signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)   # Ctrl+C
@@ -70,8 +95,8 @@ Examples:
     try:
         # Get config and create appropriate scheduler based on mode
         config = get_config()
-        scheduler = get_scheduler(config, debug=args.debug, quiet=args.quiet)
-        scheduler.run()
+        _state.scheduler = get_scheduler(config, debug=args.debug, quiet=args.quiet)
+        _state.scheduler.run()
 
     except Exception as e:
         print(f"\n[ERROR] Fatal error: {e}", file=sys.stderr)
@@ -79,9 +104,9 @@ Examples:
 
     finally:
         print()
-        print("=" * 70)
+        print(SEPARATOR)
         print("trix-hub stopped")
-        print("=" * 70)
+        print(SEPARATOR)
 
 
 if __name__ == "__main__":
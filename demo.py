@@ -6,6 +6,7 @@ Demonstrates the DataProvider/Renderer architecture with TimeProvider.
 Shows how to use both ASCII (terminal testing) and Bitmap (Matrix Portal) renderers.
 """
 
+import logging
 import sys
 import time
 from trixhub.providers import TimeProvider, WeatherProvider
@@ -70,9 +71,10 @@ def demo_bitmap_renderer():
 
     # Send to Matrix Portal (stubbed - saves to file)
     client = MatrixClient(
-        server_url="http://trix-server.local/bitmap",
+        server_hostname="http://trix-server.local",
         width=64,
-        height=32
+        height=32,
+        save_debug_files=True
     )
 
     success = client.post_bitmap(bitmap)
@@ -144,19 +146,19 @@ def demo_multiple_renderers():
     data = provider.get_data()
     print()
 
-    # Render to multiple formats
-    print("Rendering to ASCII:")
-    ascii_output = ascii_renderer.render(data)
-    print(ascii_output)
-    print()
-
+    # Render the bitmap once and derive the ASCII preview from it
     print("Rendering to Bitmap:")
     bitmap = bitmap_renderer.render(data)
     print(f"  Created {bitmap.size} bitmap")
     print()
 
+    print("Rendering to ASCII:")
+    ascii_output = ascii_renderer.render_image(bitmap)
+    print(ascii_output)
+    print()
+
     # Save bitmap
-    client = MatrixClient("http://trix-server.local/bitmap")
+    client = MatrixClient("http://trix-server.local", save_debug_files=True)
     client.post_bitmap(bitmap)
     print()
 
@@ -258,19 +260,19 @@ def demo_weather():
         print(f"  Forecast ({forecast2_time_label}, +{forecast2_hours}h): {forecast2_temp}{unit_symbol} - {forecast2_condition}")
         print()
 
-    # Render to ASCII
+    # Render the bitmap once and derive the ASCII preview from it
+    bitmap = bitmap_renderer.render(data)
+
     print("ASCII Rendering:")
-    ascii_output = ascii_renderer.render(data)
+    ascii_output = ascii_renderer.render_image(bitmap)
     print(ascii_output)
     print()
 
-    # Render to bitmap
     print("Bitmap Rendering:")
-    bitmap = bitmap_renderer.render(data)
     print(f"  Created {bitmap.size} bitmap")
 
     # Save bitmap
-    client = MatrixClient("http://trix-server.local/bitmap")
+    client = MatrixClient("http://trix-server.local", save_debug_files=True)
     success = client.post_bitmap(bitmap)
     if success:
         print("  ✓ Bitmap saved successfully")
@@ -281,6 +283,7 @@ def demo_weather():
 
 def main():
     """Run all demos"""
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
 
     if len(sys.argv) > 1:
         demo_name = sys.argv[1]
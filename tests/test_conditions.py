@@ -0,0 +1,26 @@
+"""Tests for date parsing in trixhub.conditions."""
+
+import unittest
+from datetime import datetime
+
+from trixhub.conditions import ConditionEvaluator, _parse_month_day
+
+
+class ParseMonthDayTest(unittest.TestCase):
+
+    def test_impossible_day_is_rejected(self):
+        with self.assertLogs("trixhub.conditions", level="WARNING"):
+            self.assertIsNone(_parse_month_day("04-31"))
+
+    def test_impossible_day_never_matches_next_month(self):
+        with self.assertLogs("trixhub.conditions", level="WARNING"):
+            evaluator = ConditionEvaluator({"date_match": ["04-31"]})
+        self.assertFalse(evaluator.should_run(datetime(2026, 5, 1)))
+        self.assertFalse(evaluator.should_run(datetime(2026, 4, 30)))
+
+    def test_leap_day_is_accepted(self):
+        self.assertEqual(_parse_month_day("02-29"), _parse_month_day("03-01") - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -5,25 +5,64 @@ Handles communication with trix-server (MatrixPortal M4) via HTTP POST.
 """
 
 import io
+import logging
 import os
+import queue
+import struct
+import threading
+import time
+import zlib
 from datetime import datetime
-from PIL import Image
-import requests
+from typing import TYPE_CHECKING, Callable, Optional
 
+# numpy, requests and PIL are imported when a client is created, so
+# importing this module (e.g. in --debug mode) doesn't load them
+if TYPE_CHECKING:
+    import requests
+    from PIL import Image
+
+logger = logging.getLogger(__name__)
 
 
 class MatrixClient:
     """
     Client for posting bitmaps to Matrix Portal via HTTP.
 
-    Posts BMP-formatted images to trix-server running on MatrixPortal M4.
+    Posts BMP-formatted images (or raw RGB24/RGB565 frames) to trix-server
+    running on MatrixPortal M4.
     """
 
     DISPLAY_ENDPOINT = "/display"
+    DISPLAY_RAW_ENDPOINT = "/display-raw"
     CLEAR_ENDPOINT = "/clear"
+    BMP_HEADERS = {'Content-Type': 'image/bmp'}
+    RAW_HEADERS = {'Content-Type': 'application/octet-stream'}
+
+    # Supported payload encodings for post_bitmap
+    WIRE_FORMATS = ("bmp", "raw_rgb", "rgb565")
+
+    # rgb565 payloads start with this magic, then uint16 LE width and height
+    RGB565_MAGIC = b"R565"
+
+    # Number of encoded frames to keep, keyed by image object
+    FRAME_CACHE_SIZE = 8
+
+    # Seconds after which an unchanged frame is sent again anyway, in case
+    # trix-server restarted or something else drew on the panel
+    FRAME_RESEND_INTERVAL = 60
+
+    __slots__ = (
+        'server_hostname', 'width', 'height', 'output_dir', 'timeout',
+        'save_debug_files', 'wire_format', 'session', 'last_status',
+        '_np', '_requests', '_shared_session',
+        '_display_url', '_display_headers', '_encode', '_clear_url',
+        '_rgb565_header', '_bmp_frame', '_bmp_pixels',
+        '_frame_cache', '_last_hash', '_last_hash_time', '_post_queue', '_post_thread',
+    )
 
     def __init__(self, server_hostname: str, width: int = 64, height: int = 32,
-                 output_dir: str = "output", timeout: int = 5, save_debug_files: bool = False):
+                 output_dir: str = "output", timeout: int = 5, save_debug_files: bool = False,
+                 session: "requests.Session" = None, wire_format: str = "bmp"):
         """
         Initialize Matrix Portal client.
 
@@ -34,123 +73,377 @@ class MatrixClient:
             output_dir: Directory to save debug bitmap files (only used if save_debug_files=True)
             timeout: HTTP request timeout in seconds (default: 5)
             save_debug_files: If True, save bitmap files locally for debugging (default: False)
+            session: requests.Session to use (default: shared trixhub.http.SESSION)
+            wire_format: Payload encoding: "bmp" for 24bpp BMP to /display,
+                "raw_rgb" for headerless 24bpp pixels to /display-raw (size and
+                format in X-Width/X-Height/X-Format headers), or "rgb565" for
+                packed 16bpp frames to /display-raw (default: "bmp")
+
+        Raises:
+            ValueError: If wire_format is not supported
         """
+        if wire_format not in self.WIRE_FORMATS:
+            raise ValueError(f"Unsupported wire format: {wire_format}")
+
+        import numpy
+        import requests
+        from ..http import SESSION
+        self._np = numpy
+        self._requests = requests
+
         self.server_hostname = server_hostname.rstrip('/')
         self.width = width
         self.height = height
         self.output_dir = output_dir
         self.timeout = timeout
         self.save_debug_files = save_debug_files
+        self.wire_format = wire_format
+
+        # Prebuild endpoint URLs and pick the encoder once, so the post path
+        # doesn't re-concatenate or re-dispatch on every frame
+        if wire_format == "rgb565":
+            self._display_url = self.server_hostname + self.DISPLAY_RAW_ENDPOINT
+            self._display_headers = self.RAW_HEADERS
+            self._encode = self._image_to_rgb565_bytes
+        elif wire_format == "raw_rgb":
+            self._display_url = self.server_hostname + self.DISPLAY_RAW_ENDPOINT
+            self._display_headers = {
+                **self.RAW_HEADERS,
+                'X-Width': str(width),
+                'X-Height': str(height),
+                'X-Format': 'rgb24',
+            }
+            self._encode = self._image_to_raw_bytes
+        else:
+            self._display_url = self.server_hostname + self.DISPLAY_ENDPOINT
+            self._display_headers = self.BMP_HEADERS
+            self._encode = self._image_to_bmp_bytes
+        self._clear_url = self.server_hostname + self.CLEAR_ENDPOINT
+
+        # Persistent session so keep-alive reuses the TCP connection across posts
+        self.session = session if session is not None else SESSION
+        self._shared_session = session is None
+
+        # Frame size is fixed, so the whole BMP file is one reusable buffer:
+        # the header is written once, row padding stays zeroed, and frames
+        # are flipped/swapped straight into a NumPy view of the pixel area
+        header = self._build_bmp_header(width, height)
+        row_size = (width * 3 + 3) & ~3
+        self._rgb565_header = self._build_rgb565_header(width, height)
+        self._bmp_frame = bytearray(len(header) + row_size * height)
+        self._bmp_frame[:len(header)] = header
+        bmp_rows = numpy.frombuffer(self._bmp_frame, dtype=numpy.uint8, offset=len(header))
+        self._bmp_pixels = bmp_rows.reshape(height, row_size)[:, :width * 3].reshape(height, width, 3)
+
+        # id(image) -> (image, encoded bytes) for images posted again unchanged.
+        # Holding the image keeps its id from being reused while cached.
+        self._frame_cache: dict[int, tuple["Image.Image", bytes]] = {}
+
+        # CRC32 of the last payload the server accepted, i.e. what the panel
+        # is currently showing; identical frames aren't sent again until
+        # FRAME_RESEND_INTERVAL has passed since that post
+        self._last_hash = None
+        self._last_hash_time = 0.0
+
+        # Result of the most recent background post (None until one finishes)
+        self.last_status: Optional[bool] = None
+
+        # Single-slot queue for post_bitmap_async; the worker thread is
+        # started on first use
+        self._post_queue: queue.Queue = queue.Queue(maxsize=1)
+        self._post_thread: Optional[threading.Thread] = None
 
         # Create output directory if debug mode enabled
-        if save_debug_files and not os.path.exists(output_dir):
-            os.makedirs(output_dir)
+        if save_debug_files:
+            os.makedirs(output_dir, exist_ok=True)
 
-    def post_bitmap(self, image: Image.Image) -> bool:
+    def post_bitmap(self, image: "Image.Image") -> bool:
         """
         Post bitmap to Matrix Portal via HTTP POST.
 
+        Skips the request if the encoded frame is identical to the last one
+        the server accepted, since the panel is already showing it.
+
         Args:
             image: PIL Image to send (should be width x height RGB)
 
         Returns:
-            True if successful, False otherwise
+            True if successful (or already displayed), False otherwise
         """
-        url = self.server_hostname + self.DISPLAY_ENDPOINT
+        url = self._display_url
         try:
             # Validate image size
             if image.size != (self.width, self.height):
-                print(f"[MatrixClient] Warning: Image size {image.size} doesn't match expected {(self.width, self.height)}")
+                logger.warning("[MatrixClient] Image size %s doesn't match expected %s",
+                               image.size, (self.width, self.height))
 
             # Convert to RGB if needed
             if image.mode != 'RGB':
                 image = image.convert('RGB')
 
-            # Convert image to BMP bytes
-            bmp_bytes = self._image_to_bmp_bytes(image)
+            # Encode image for the wire (reusing the encoding of a repeat image)
+            cached = self._frame_cache.get(id(image))
+            if cached is not None and cached[0] is image:
+                payload = cached[1]
+            else:
+                payload = self._encode(image)
+                if len(self._frame_cache) >= self.FRAME_CACHE_SIZE:
+                    del self._frame_cache[next(iter(self._frame_cache))]
+                self._frame_cache[id(image)] = (image, payload)
+
+            # Nothing to do if the panel already shows this exact frame
+            # (re-sent periodically, as the panel may have been redrawn)
+            digest = zlib.crc32(payload)
+            if (digest == self._last_hash
+                    and time.monotonic() - self._last_hash_time < self.FRAME_RESEND_INTERVAL):
+                return True
+
+            # Unknown panel state until this post succeeds
+            self._last_hash = None
 
             # POST to trix-server
-            response = requests.post(
-                url,
-                data=bmp_bytes,
-                headers={'Content-Type': 'image/bmp'},
-                timeout=self.timeout
-            )
+            response = self.session.post(url, data=payload, headers=self._display_headers, timeout=self.timeout)
 
             # Check response
             if response.status_code == 200:
+                self._last_hash = digest
+                self._last_hash_time = time.monotonic()
                 # Optionally save debug file
                 if self.save_debug_files:
-                    self._save_debug_file(image)
+                    self._save_debug_file(image, payload)
                 return True
             else:
-                print(f"[MatrixClient] HTTP {response.status_code}: {response.text}")
+                logger.error("[MatrixClient] HTTP %s: %s", response.status_code, response.text)
                 return False
 
-        except requests.exceptions.Timeout:
-            print(f"[MatrixClient] Timeout connecting to {url}")
+        except self._requests.exceptions.Timeout:
+            logger.warning("[MatrixClient] Timeout connecting to %s", url)
             return False
-        except requests.exceptions.ConnectionError:
-            print(f"[MatrixClient] Connection error: {url} unreachable")
+        except self._requests.exceptions.ConnectionError:
+            logger.warning("[MatrixClient] Connection error: %s unreachable", url)
             return False
         except Exception as e:
-            print(f"[MatrixClient] Error: {e}")
+            logger.error("[MatrixClient] Error: %s", e)
             return False
 
-    def clear_display(self) -> bool:
+    def post_bitmap_async(self, image: "Image.Image",
+                          callback: Callable[[bool], None] = None) -> None:
+        """
+        Queue a bitmap to be posted from a background thread.
+
+        Returns immediately, so the caller can render the next frame while
+        this one is in flight. Only the latest frame is kept: a frame still
+        waiting to be sent is stale and is replaced rather than queued
+        behind.
+
+        Args:
+            image: PIL Image to send (should be width x height RGB)
+            callback: Optional function called from the worker thread with
+                the post_bitmap result (not called for replaced frames)
+        """
+        if self._post_thread is None:
+            self._post_thread = threading.Thread(target=self._post_worker, name="matrix-post", daemon=True)
+            self._post_thread.start()
+
+        item = (image, callback)
+        try:
+            self._post_queue.put_nowait(item)
+        except queue.Full:
+            self._drop_pending()
+            self._post_queue.put_nowait(item)
+
+    def _post_worker(self) -> None:
+        """Post queued bitmaps, recording and reporting the result of each."""
+        while True:
+            image, callback = self._post_queue.get()
+            self.last_status = self.post_bitmap(image)
+            if callback is not None:
+                callback(self.last_status)
+
+    def _drop_pending(self) -> None:
+        """Discard a queued frame that hasn't been picked up by the worker."""
+        try:
+            self._post_queue.get_nowait()
+        except queue.Empty:
+            pass
+
+    def clear_display(self, timeout: float = None) -> bool:
         """
         Clear the Matrix Portal display by sending a GET to the /clear endpoint.
+
+        Args:
+            timeout: Request timeout in seconds (default: client timeout).
+                The shutdown path passes a short one so an unreachable
+                server can't hold up the exit.
+
         Returns:
             True if successful, False otherwise
         """
-        url = self.server_hostname + self.CLEAR_ENDPOINT
+        url = self._clear_url
+        if timeout is None:
+            timeout = self.timeout
+        # A frame queued before the clear must not be drawn after it
+        self._drop_pending()
         try:
-            response = requests.get(url, timeout=self.timeout)
+            # Whatever happens, the panel may no longer show the last frame
+            self._last_hash = None
+            response = self.session.get(url, timeout=timeout)
             if response.status_code == 200:
                 return True
             else:
-                print(f"[MatrixClient] Clear display HTTP {response.status_code}: {response.text}")
+                logger.error("[MatrixClient] Clear display HTTP %s: %s", response.status_code, response.text)
                 return False
-        except requests.exceptions.Timeout:
-            print(f"[MatrixClient] Timeout connecting to {url}")
+        except self._requests.exceptions.Timeout:
+            logger.warning("[MatrixClient] Timeout connecting to %s", url)
             return False
-        except requests.exceptions.ConnectionError:
-            print(f"[MatrixClient] Connection error: {url} unreachable")
+        except self._requests.exceptions.ConnectionError:
+            logger.warning("[MatrixClient] Connection error: %s unreachable", url)
             return False
         except Exception as e:
-            print(f"[MatrixClient] Error clearing display: {e}")
+            logger.error("[MatrixClient] Error clearing display: %s", e)
             return False
 
-    def _image_to_bmp_bytes(self, image: Image.Image) -> bytes:
+    @staticmethod
+    def _build_bmp_header(width: int, height: int) -> bytes:
+        """
+        Build the 54-byte BMP file header + BITMAPINFOHEADER for a 24bpp frame.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+
+        Returns:
+            Header bytes to prepend to the pixel data
+        """
+        row_size = (width * 3 + 3) & ~3  # Rows are padded to 4-byte boundaries
+        image_size = row_size * height
+        return struct.pack(
+            '<2sIHHIIiiHHIIiiII',
+            b'BM', 54 + image_size, 0, 0, 54,          # BITMAPFILEHEADER
+            40, width, height, 1, 24, 0, image_size,   # BITMAPINFOHEADER
+            3780, 3780, 0, 0                           # 96 DPI (as Pillow writes), no palette
+        )
+
+    def _image_to_bmp_bytes(self, image: "Image.Image") -> bytes:
         """
         Convert PIL Image to BMP format bytes.
 
+        Packs pixels with NumPy into a preallocated BMP file buffer instead
+        of going through PIL's BMP encoder. Images that don't match the
+        configured size fall back to PIL.
+
         Args:
-            image: PIL Image to convert
+            image: PIL Image to convert (must already be RGB mode;
+                post_bitmap converts before encoding)
 
         Returns:
             BMP-formatted bytes
         """
-        # Ensure RGB mode
-        if image.mode != 'RGB':
-            image = image.convert('RGB')
+        assert image.mode == 'RGB', f"expected RGB image, got {image.mode}"
+
+        if image.size != (self.width, self.height):
+            buffer = io.BytesIO()
+            image.save(buffer, format='BMP')
+            return buffer.getvalue()
+
+        # BMP stores rows bottom-up in BGR order; one strided copy does both
+        np = self._np
+        np.copyto(self._bmp_pixels, np.asarray(image, dtype=np.uint8)[::-1, :, ::-1])
+        return bytes(self._bmp_frame)
+
+    def _image_to_raw_bytes(self, image: "Image.Image") -> bytes:
+        """
+        Convert PIL Image to headerless RGB24 bytes.
+
+        Returns PIL's internal pixel buffer directly (row-major, top-down,
+        no padding). The frame size is sent in request headers, so the
+        image must match the configured size.
+
+        Args:
+            image: PIL Image (RGB mode) to convert
 
-        # Convert to BMP bytes
-        buffer = io.BytesIO()
-        image.save(buffer, format='BMP')
-        return buffer.getvalue()
+        Returns:
+            width * height * 3 bytes of pixel data
+
+        Raises:
+            ValueError: If the image doesn't match the configured size
+        """
+        if image.size != (self.width, self.height):
+            raise ValueError(f"raw_rgb frames must be {self.width}x{self.height}, got {image.size}")
+        return image.tobytes()
 
-    def _save_debug_file(self, image: Image.Image) -> None:
+    @classmethod
+    def _build_rgb565_header(cls, width: int, height: int) -> bytes:
+        """
+        Build the 8-byte header for an rgb565 frame.
+
+        Args:
+            width: Frame width in pixels
+            height: Frame height in pixels
+
+        Returns:
+            Magic followed by little-endian uint16 width and height
+        """
+        return struct.pack('<4sHH', cls.RGB565_MAGIC, width, height)
+
+    def _image_to_rgb565_bytes(self, image: "Image.Image") -> bytes:
+        """
+        Convert PIL Image to a packed RGB565 frame.
+
+        The frame is an 8-byte header (magic, width, height) followed by
+        pixels row-major, top-down, as little-endian 16-bit values (5 bits
+        red, 6 green, 5 blue), matching the M4's native framebuffer order.
+
+        Args:
+            image: PIL Image (RGB mode) to convert
+
+        Returns:
+            8 + width * height * 2 bytes
+        """
+        if image.size == (self.width, self.height):
+            header = self._rgb565_header
+        else:
+            header = self._build_rgb565_header(*image.size)
+
+        np = self._np
+        arr = np.asarray(image, dtype=np.uint16)
+        r = (arr[..., 0] & 0xF8) << 8
+        g = (arr[..., 1] & 0xFC) << 3
+        b = arr[..., 2] >> 3
+        return header + (r | g | b).astype('<u2').tobytes()
+
+    def _save_debug_file(self, image: "Image.Image", payload: bytes) -> None:
         """
         Save bitmap to file for debugging purposes.
 
+        In BMP wire format the payload already is the file, so it's written
+        as-is instead of being encoded again by PIL.
+
         Args:
-            image: PIL Image to save
+            image: PIL Image that was posted
+            payload: Encoded bytes that were posted
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Microseconds keep frames saved within the same second from colliding
+        t = datetime.now()
+        timestamp = (f"{t.year:04d}{t.month:02d}{t.day:02d}_"
+                     f"{t.hour:02d}{t.minute:02d}{t.second:02d}_{t.microsecond:06d}")
         filename = f"{self.output_dir}/matrix_{timestamp}.bmp"
-        image.save(filename, format='BMP')
-        print(f"[MatrixClient] Debug: Saved bitmap to {filename}")
+        if self.wire_format == "bmp":
+            with open(filename, 'wb') as f:
+                f.write(payload)
+        else:
+            image.save(filename, format='BMP')
+        logger.info("[MatrixClient] Debug: Saved bitmap to %s", filename)
+
+    def close(self) -> None:
+        """
+        Release pooled connections held for this client.
+
+        The shared trixhub.http session is left open for other components;
+        a session passed in by the caller is closed.
+        """
+        if not self._shared_session:
+            self.session.close()
 
     def test_connection(self) -> bool:
         """
@@ -160,12 +453,12 @@ class MatrixClient:
             True if server is reachable, False otherwise
         """
         try:
-            response = requests.get(
+            response = self.session.get(
                 self.server_hostname,
                 timeout=self.timeout
             )
-            return response.status_code in [200, 404]  # 404 is ok, means server is up
-        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            return response.status_code in (200, 404)  # 404 is ok, means server is up
+        except (self._requests.exceptions.Timeout, self._requests.exceptions.ConnectionError):
             return False
         except Exception:
             return False
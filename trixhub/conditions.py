@@ -5,9 +5,55 @@ Supports date-based conditions for conditional provider triggering.
 Examples: birthdays, holidays, weekends, seasonal content.
 """
 
+import logging
 from datetime import datetime
 from typing import Dict, Any, List, Optional
 
+logger = logging.getLogger(__name__)
+
+
+# Days before each month in a leap year, so every "MM-DD" (including 02-29)
+# maps to a distinct integer that sorts the same way as the string
+_DAYS_BEFORE_MONTH = (0, 31, 60, 91, 121, 152, 182, 213, 244, 274, 305, 335)
+
+# Longest each month can be (February allows 29 so "02-29" is accepted)
+_DAYS_IN_MONTH = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _day_number(month: int, day: int) -> int:
+    """
+    Convert a month and day to a year-independent day number (1-366).
+
+    Args:
+        month: Month (1-12)
+        day: Day of month (1-31)
+
+    Returns:
+        Day number ordered by calendar date
+    """
+    return _DAYS_BEFORE_MONTH[month - 1] + day
+
+
+def _parse_month_day(date_str: str) -> Optional[int]:
+    """
+    Parse an "MM-DD" config string to a day number.
+
+    Args:
+        date_str: Date in "MM-DD" format
+
+    Returns:
+        Day number, or None if the string is invalid (never matches)
+    """
+    try:
+        month, day = (int(part) for part in date_str.split("-"))
+        # Impossible days (e.g. "04-31") would otherwise run into the next month
+        if 1 <= month <= 12 and 1 <= day <= _DAYS_IN_MONTH[month - 1]:
+            return _day_number(month, day)
+    except (ValueError, AttributeError):
+        pass
+    logger.warning("[Conditions] Invalid date %r, expected MM-DD", date_str)
+    return None
+
 
 class ConditionEvaluator:
     """
@@ -17,6 +63,8 @@ class ConditionEvaluator:
     All conditions must pass for the provider to run.
     """
 
+    __slots__ = ('conditions', '_dates', '_days', '_months', '_range', '_has_any')
+
     def __init__(self, conditions: Dict[str, Any]):
         """
         Initialize condition evaluator.
@@ -26,62 +74,80 @@ class ConditionEvaluator:
         """
         self.conditions = conditions or {}
 
-    def should_run(self) -> bool:
+        # Condition values are fixed, so convert them once for fast lookups.
+        # Dates are stored as day numbers so checks compare ints, not strings.
+        self._dates = frozenset(map(_parse_month_day, self.conditions.get("date_match") or ()))
+        self._days = frozenset(self.conditions.get("day_of_week") or ())
+        self._months = frozenset(self.conditions.get("months") or ())
+        date_range = self.conditions.get("date_range") or ()
+        self._range = tuple(map(_parse_month_day, date_range)) if len(date_range) == 2 else ()
+        self._has_any = bool(self._dates or self._days or self._months or self._range)
+
+    def should_run(self, now: Optional[datetime] = None) -> bool:
         """
         Evaluate all conditions (AND logic).
 
+        Args:
+            now: Time to evaluate against (default: current local time)
+
         Returns:
             True if all conditions pass (or no conditions), False otherwise
         """
-        if not self.conditions:
+        if not self._has_any:
             return True
 
-        # All conditions must pass (AND logic)
-        # None means condition not configured, skip it
-        checks = [
-            self._check_date_match(),
-            self._check_date_range(),
-            self._check_day_of_week(),
-            self._check_months()
-        ]
-
-        return all(check for check in checks if check is not None)
+        # Read the clock and compute today's day number once for all checks
+        if now is None:
+            now = datetime.now()
+        today = _day_number(now.month, now.day)
 
-    def _check_date_match(self) -> Optional[bool]:
+        # All conditions must pass (AND logic), so stop at the first failure.
+        # None means condition not configured, skip it
+        if self._check_date_match(today) is False:
+            return False
+        if self._check_date_range(today) is False:
+            return False
+        if self._check_day_of_week(now) is False:
+            return False
+        return self._check_months(now) is not False
+
+    def _check_date_match(self, today: int) -> Optional[bool]:
         """
         Check if today matches any date in date_match list.
 
         Config format: "date_match": ["MM-DD", "MM-DD", ...]
         Example: ["01-15", "06-22", "12-25"] for specific dates
 
+        Args:
+            today: Today's day number (see _day_number)
+
         Returns:
             True if today matches, False if not, None if not configured
         """
-        date_list = self.conditions.get("date_match")
-        if not date_list:
+        if not self._dates:
             return None
 
-        now = datetime.now()
-        today = now.strftime("%m-%d")
-        return today in date_list
+        return today in self._dates
 
-    def _check_date_range(self) -> Optional[bool]:
+    def _check_date_range(self, today: int) -> Optional[bool]:
         """
         Check if today is within date_range.
 
         Config format: "date_range": ["MM-DD", "MM-DD"]
         Supports year wraparound (e.g., ["12-20", "01-10"] for winter holidays)
 
+        Args:
+            today: Today's day number (see _day_number)
+
         Returns:
             True if in range, False if not, None if not configured
         """
-        date_range = self.conditions.get("date_range")
-        if not date_range or len(date_range) != 2:
+        if not self._range:
             return None
 
-        now = datetime.now()
-        today = now.strftime("%m-%d")
-        start, end = date_range
+        start, end = self._range
+        if start is None or end is None:
+            return False  # Invalid range never matches
 
         # Handle year wraparound (e.g., 12-20 to 01-10)
         if start <= end:
@@ -91,40 +157,42 @@ class ConditionEvaluator:
             # Wraparound range (e.g., 12-20 to 01-10 for winter holidays)
             return today >= start or today <= end
 
-    def _check_day_of_week(self) -> Optional[bool]:
+    def _check_day_of_week(self, now: datetime) -> Optional[bool]:
         """
         Check if today is in day_of_week list.
 
         Config format: "day_of_week": [0, 1, 2, ...]
         Where 0=Sunday, 1=Monday, ..., 6=Saturday
 
+        Args:
+            now: Time being evaluated
+
         Returns:
             True if matches, False if not, None if not configured
         """
-        days = self.conditions.get("day_of_week")
-        if not days:
+        if not self._days:
             return None
 
-        now = datetime.now()
         # Python datetime: 0=Monday, 6=Sunday
         # Our config: 0=Sunday, 6=Saturday
         # Convert: (Python weekday + 1) % 7
         weekday = (now.weekday() + 1) % 7
-        return weekday in days
+        return weekday in self._days
 
-    def _check_months(self) -> Optional[bool]:
+    def _check_months(self, now: datetime) -> Optional[bool]:
         """
         Check if current month is in months list.
 
         Config format: "months": [1, 2, 3, ...]
         Where 1=January, 12=December
 
+        Args:
+            now: Time being evaluated
+
         Returns:
             True if matches, False if not, None if not configured
         """
-        months = self.conditions.get("months")
-        if not months:
+        if not self._months:
             return None
 
-        now = datetime.now()
-        return now.month in months
+        return now.month in self._months
@@ -4,10 +4,21 @@ Configuration loader for trix-hub.
 Loads settings from config.json with sensible defaults.
 """
 
-import json
+import copy
+import logging
 import os
+import threading
 from typing import Any, Dict
 
+# orjson parses straight from bytes and is several times faster;
+# fall back to the stdlib if it isn't installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+logger = logging.getLogger(__name__)
+
 
 # Default configuration
 DEFAULT_CONFIG = {
@@ -32,6 +43,13 @@ DEFAULT_CONFIG = {
 }
 
 
+# Parsed config files keyed by (path, mtime, size), so constructing another
+# Config for an unchanged file skips re-reading and re-parsing it.
+# Each instance gets its own deep copy, so edits never leak between them.
+_CACHE: Dict[tuple, Dict[str, Any]] = {}
+_CACHE_LOCK = threading.Lock()
+
+
 class Config:
     """
     Configuration manager for trix-hub.
@@ -39,6 +57,8 @@ class Config:
     Loads config.json from project root, falling back to defaults.
     """
 
+    __slots__ = ('config_path', '_config', '_flat')
+
     def __init__(self, config_path: str = "config.json"):
         """
         Initialize configuration.
@@ -47,26 +67,75 @@ class Config:
             config_path: Path to config file (default: config.json in current directory)
         """
         self.config_path = config_path
+        # Setting config also builds the key path index used by get()
         self.config = self._load_config()
 
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Loaded configuration dictionary."""
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]) -> None:
+        """
+        Replace the configuration and rebuild the key path index.
+
+        The index holds values by path, so after editing the dict in place
+        assign it back (``cfg.config = cfg.config``) for get() to see the edit.
+
+        Args:
+            value: New configuration dictionary
+        """
+        self._config = value
+        # Every key path (leaves and subtrees) -> value, so get() is one lookup
+        self._flat: Dict[tuple, Any] = {}
+        self._flatten(value, ())
+
+    def _flatten(self, value: Any, path: tuple) -> None:
+        """
+        Index a config value and everything nested under it by key path.
+
+        Args:
+            value: Config value at path
+            path: Tuple of keys leading to value
+        """
+        self._flat[path] = value
+        if isinstance(value, dict):
+            for key, child in value.items():
+                self._flatten(child, path + (key,))
+
     def _load_config(self) -> Dict[str, Any]:
         """
         Load configuration from file or use defaults.
 
+        Reuses a previous parse of the same file if its mtime and size
+        haven't changed.
+
         Returns:
-            Configuration dictionary
+            Configuration dictionary (a private copy for this instance)
         """
-        if os.path.exists(self.config_path):
-            try:
-                with open(self.config_path, 'r') as f:
-                    return json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Warning: Could not load {self.config_path}: {e}")
-                print("Using default configuration")
-                return DEFAULT_CONFIG.copy()
-        else:
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
             # Config file doesn't exist, use defaults
-            return DEFAULT_CONFIG.copy()
+            return copy.deepcopy(DEFAULT_CONFIG)
+
+        key = (self.config_path, st.st_mtime, st.st_size)
+        with _CACHE_LOCK:
+            cached = _CACHE.get(key)
+            if cached is not None:
+                return copy.deepcopy(cached)
+
+            try:
+                with open(self.config_path, 'rb') as f:
+                    config = json_loads(f.read())
+            except (ValueError, IOError) as e:
+                logger.warning("Could not load %s: %s", self.config_path, e)
+                logger.warning("Using default configuration")
+                return copy.deepcopy(DEFAULT_CONFIG)
+
+            _CACHE[key] = config
+            return copy.deepcopy(config)
 
     def get(self, *keys: str, default: Any = None) -> Any:
         """
@@ -83,13 +152,7 @@ class Config:
             config.get("providers", "weather", "location", "latitude")
             # Returns: 40.0
         """
-        value = self.config
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-        return value
+        return self._flat.get(keys, default)
 
     def get_provider_config(self, provider_name: str) -> Dict[str, Any]:
         """
@@ -133,18 +196,22 @@ class Config:
 
 # Global config instance
 _config = None
+_config_lock = threading.Lock()
 
 
 def get_config() -> Config:
     """
     Get global configuration instance.
 
-    Lazy-loads configuration on first access.
+    Lazy-loads configuration on first access. Safe to call from multiple
+    threads; the config is only loaded once.
 
     Returns:
         Config instance
     """
     global _config
     if _config is None:
-        _config = Config()
+        with _config_lock:
+            if _config is None:
+                _config = Config()
     return _config
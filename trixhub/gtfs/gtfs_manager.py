@@ -5,17 +5,35 @@ Handles downloading, parsing, and querying GTFS static schedule data,
 plus fetching and merging GTFS-Realtime trip updates.
 """
 
+import hashlib
+import heapq
+import logging
 import os
 import zipfile
 import tempfile
 import shutil
 import pickle
+import threading
 import time
 from datetime import datetime, timedelta, time as dt_time
-from typing import List, Dict, Any, Optional
+from operator import itemgetter
+from typing import List, Dict, Any, Optional, Tuple
 import requests
+
+# The protobuf backend is chosen by the entry point (app.py prefers upb)
+from google.protobuf.internal import api_implementation
 from google.transit import gtfs_realtime_pb2
 
+from ..http import SESSION
+
+# Optional zstd compression for the feed pickle (stored uncompressed without it)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
 # Lazy import gtfs_kit - only loaded when actually parsing GTFS data
 # This defers ~26s import cost until first bus data fetch
 _gtfs_kit = None
@@ -32,6 +50,7 @@ def _get_gtfs_kit():
 # Key: (static_url, realtime_url) tuple
 # Value: GTFSManager instance
 _manager_instances = {}
+_manager_lock = threading.Lock()
 
 def get_gtfs_manager(static_url: str, realtime_url: str,
                      cache_dir: str = None, cache_days: int = 30) -> 'GTFSManager':
@@ -52,18 +71,19 @@ def get_gtfs_manager(static_url: str, realtime_url: str,
     """
     key = (static_url, realtime_url)
 
-    if key not in _manager_instances:
-        print(f"[GTFSManager] Creating new singleton instance for {static_url}")
-        _manager_instances[key] = GTFSManager(
-            static_url=static_url,
-            realtime_url=realtime_url,
-            cache_dir=cache_dir,
-            cache_days=cache_days
-        )
-    else:
-        print(f"[GTFSManager] Reusing existing singleton instance for {static_url}")
+    with _manager_lock:
+        if key not in _manager_instances:
+            print(f"[GTFSManager] Creating new singleton instance for {static_url}")
+            _manager_instances[key] = GTFSManager(
+                static_url=static_url,
+                realtime_url=realtime_url,
+                cache_dir=cache_dir,
+                cache_days=cache_days
+            )
+        else:
+            print(f"[GTFSManager] Reusing existing singleton instance for {static_url}")
 
-    return _manager_instances[key]
+        return _manager_instances[key]
 
 
 class GTFSManager:
@@ -77,6 +97,24 @@ class GTFSManager:
     - Merging scheduled and realtime arrivals
     """
 
+    # Seconds a fetched realtime feed is reused before hitting the server again
+    REALTIME_TTL = 10
+
+    # Up to this age an expired realtime feed is still served while a
+    # background refresh runs; older than this, callers wait for a fetch
+    REALTIME_MAX_AGE = 120
+
+    # Optional GTFS tables the queries never read; dropped at load to save
+    # memory and pickle size (shapes.txt is often the largest file)
+    UNUSED_TABLES = (
+        'shapes', 'calendar_dates', 'frequencies', 'transfers',
+        'fare_attributes', 'fare_rules',
+    )
+
+    # Layout of the lookup indexes stored alongside the feed in pickles;
+    # bump when _prepare_feed changes so older pickles are re-prepared
+    PICKLE_VERSION = 5
+
     def __init__(self, static_url: str, realtime_url: str, cache_dir: str = None, cache_days: int = 30):
         """
         Initialize GTFS manager.
@@ -91,6 +129,10 @@ class GTFSManager:
         self.realtime_url = realtime_url
         self.cache_days = cache_days
 
+        if api_implementation.Type() == 'python':
+            logger.warning("[GTFSManager] protobuf is using the pure-Python backend; "
+                           "realtime feed parsing will be slow")
+
         # Set up cache directory - prefer persistent location
         if cache_dir is None:
             # Try to use persistent location, fall back to temp
@@ -103,68 +145,276 @@ class GTFSManager:
 
         os.makedirs(self.cache_dir, exist_ok=True)
 
-        # GTFS feed object (loaded lazily)
+        # GTFS feed object (loaded lazily, once, under _feed_lock)
         self.feed = None
         self.last_static_update = None
+        self._feed_lock = threading.Lock()
+
+        # Lookup indexes derived from the feed (built by _prepare_feed)
+        self._trip_lookup = {}
+        self._schedule = {}
+        self._stop_slices = {}
 
-    def _download_static_feed(self) -> str:
+        # Last realtime fetch: (monotonic time, arrivals by stop, ETag, Last-Modified)
+        self._rt_cache = (None, None, None, None)
+        self._rt_lock = threading.Lock()
+        self._rt_refresh_thread = None
+
+        # Scheduled-arrival results for the current minute and feed load:
+        # ((minute, last_static_update) stamp, {(stop_id, window): arrivals}),
+        # swapped as one tuple under _scheduled_lock
+        self._scheduled_cache: Tuple[Optional[tuple], Dict[tuple, list]] = (None, {})
+        self._scheduled_lock = threading.Lock()
+
+    def _read_validator(self, filename: str) -> Optional[str]:
+        """
+        Read a saved HTTP cache validator (ETag / Last-Modified) for the static ZIP.
+
+        Args:
+            filename: Validator file name in the cache directory
+
+        Returns:
+            Saved header value, or None if not saved
+        """
+        try:
+            with open(os.path.join(self.cache_dir, filename), 'r') as f:
+                return f.read().strip() or None
+        except OSError:
+            return None
+
+    def _write_validator(self, filename: str, value: Optional[str]) -> None:
+        """
+        Save (or clear) an HTTP cache validator for the static ZIP.
+
+        Args:
+            filename: Validator file name in the cache directory
+            value: Header value from the response, or None to remove
+        """
+        path = os.path.join(self.cache_dir, filename)
+        if value:
+            with open(path, 'w') as f:
+                f.write(value)
+        elif os.path.exists(path):
+            os.remove(path)
+
+    def _download_static_feed(self) -> Tuple[str, bool]:
         """
         Download GTFS static ZIP file.
 
+        Sends If-None-Match / If-Modified-Since from the previous download so
+        an unchanged feed costs a single 304 round-trip.
+
         Returns:
-            Path to downloaded ZIP file
+            Tuple of (path to ZIP file, True if a new file was downloaded)
         """
         zip_path = os.path.join(self.cache_dir, "gtfs_static.zip")
 
+        headers = {}
+        if os.path.exists(zip_path):
+            etag = self._read_validator("etag.txt")
+            last_modified = self._read_validator("last_modified.txt")
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
         print(f"[GTFSManager] Downloading GTFS static data from {self.static_url}")
-        response = requests.get(self.static_url, timeout=30)
-        response.raise_for_status()
+        response = SESSION.get(self.static_url, headers=headers, timeout=30, stream=True)
+        with response:
+            if response.status_code == 304 and headers:
+                print("[GTFSManager] GTFS static data not modified, using cached ZIP")
+                return zip_path, False
+            response.raise_for_status()
+
+            # Stream straight to disk rather than holding the whole ZIP in memory
+            # (iter_content also undoes any gzip/deflate transfer encoding).
+            # Write to a temp file renamed into place, so a failed download
+            # never leaves a truncated ZIP behind the saved validators.
+            digest = hashlib.sha1()
+            tmp_path = zip_path + ".part"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=1 << 20):
+                        f.write(chunk)
+                        digest.update(chunk)
+                    size = f.tell()
+
+                # Drop the old ZIP's validators first: if we stop before the
+                # new ones are written, the next run re-hashes/re-downloads
+                for filename in ("zip_sha1.txt", "etag.txt", "last_modified.txt"):
+                    self._write_validator(filename, None)
+                os.replace(tmp_path, zip_path)
+            except BaseException:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+            self._write_validator("zip_sha1.txt", digest.hexdigest())
+            self._write_validator("etag.txt", response.headers.get('ETag'))
+            self._write_validator("last_modified.txt", response.headers.get('Last-Modified'))
+
+        print(f"[GTFSManager] Downloaded GTFS static data ({size} bytes)")
+        return zip_path, True
+
+    def _list_pickles(self) -> List[Tuple[int, str]]:
+        """
+        List pickle cache files with their expiration timestamps.
+
+        Returns:
+            List of (expiration_timestamp, filename), newest expiration first
+        """
+        pickles = []
+
+        # Look for pickle files matching pattern: gtfs_feed_{expiration_timestamp}.pickle[.zst]
+        with os.scandir(self.cache_dir) as entries:
+            for entry in entries:
+                name = entry.name
+                if not name.startswith("gtfs_feed_"):
+                    continue
+                expiration_str, _, suffix = name[len("gtfs_feed_"):].partition(".")
+                if suffix not in ("pickle", "pickle.zst"):
+                    continue
+
+                # Extract expiration timestamp from filename
+                try:
+                    pickles.append((int(expiration_str), name))
+                except ValueError as e:
+                    # Invalid filename format - skip
+                    print(f"[GTFSManager] Warning: Invalid pickle file {name}: {e}")
+
+        pickles.sort(reverse=True)
+        return pickles
+
+    def _get_zip_digest(self, zip_path: str) -> str:
+        """
+        Get the SHA-1 of the static ZIP, as saved at download time.
+
+        Falls back to hashing the file (and saving the result) for ZIPs
+        downloaded before digests were recorded.
+
+        Args:
+            zip_path: Path to the static ZIP
+
+        Returns:
+            Hex SHA-1 digest of the ZIP contents
+        """
+        digest = self._read_validator("zip_sha1.txt")
+        if digest:
+            return digest
+
+        sha1 = hashlib.sha1()
+        with open(zip_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                sha1.update(chunk)
+        digest = sha1.hexdigest()
+        self._write_validator("zip_sha1.txt", digest)
+        return digest
+
+    def _extract_static_feed(self, zip_path: str) -> str:
+        """
+        Extract the static ZIP into a directory named by its content hash.
 
-        with open(zip_path, 'wb') as f:
-            f.write(response.content)
+        An existing directory for the same ZIP is reused as-is. Extraction
+        goes to a temporary directory that is renamed into place, so a
+        partial extraction is never mistaken for a complete one. Directories
+        for older ZIPs are removed.
 
-        print(f"[GTFSManager] Downloaded GTFS static data ({len(response.content)} bytes)")
-        return zip_path
+        Args:
+            zip_path: Path to the static ZIP
 
-    def _get_pickle_path(self) -> Optional[str]:
+        Returns:
+            Path to the extracted feed directory
+        """
+        dir_name = f"gtfs_extracted_{self._get_zip_digest(zip_path)[:16]}"
+        extract_dir = os.path.join(self.cache_dir, dir_name)
+
+        if not os.path.isdir(extract_dir):
+            tmp_dir = extract_dir + ".tmp"
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+            os.makedirs(tmp_dir)
+
+            # Extract ZIP
+            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+                zip_ref.extractall(tmp_dir)
+            os.replace(tmp_dir, extract_dir)
+
+        # Remove extractions of previous ZIPs (including the old fixed-name dir)
+        for entry in os.listdir(self.cache_dir):
+            if entry.startswith("gtfs_extracted") and entry != dir_name:
+                shutil.rmtree(os.path.join(self.cache_dir, entry), ignore_errors=True)
+
+        return extract_dir
+
+    def _get_pickle_path(self, include_expired: bool = False) -> Optional[str]:
         """
         Find existing valid pickle file or return None.
 
+        Expired pickles are kept on disk until a new one is saved, so an
+        unchanged static feed (304) can reuse the last parse.
+
+        Args:
+            include_expired: If True, return the newest pickle even if expired
+
         Returns:
             Path to valid pickle file, or None if no valid cache exists
         """
-        # Look for pickle files matching pattern: gtfs_feed_*.pickle
-        pickle_files = [f for f in os.listdir(self.cache_dir) if f.startswith("gtfs_feed_") and f.endswith(".pickle")]
+        for expiration_timestamp, pickle_file in self._list_pickles():
+            # Check if expired
+            if include_expired or time.time() < expiration_timestamp:
+                return os.path.join(self.cache_dir, pickle_file)
 
-        for pickle_file in pickle_files:
-            # Extract expiration timestamp from filename
-            try:
-                # Format: gtfs_feed_{expiration_timestamp}.pickle
-                expiration_str = pickle_file.replace("gtfs_feed_", "").replace(".pickle", "")
-                expiration_timestamp = int(expiration_str)
-
-                # Check if expired
-                if time.time() < expiration_timestamp:
-                    # Still valid
-                    return os.path.join(self.cache_dir, pickle_file)
-                else:
-                    # Expired - delete it
-                    expired_path = os.path.join(self.cache_dir, pickle_file)
-                    print(f"[GTFSManager] Removing expired pickle: {pickle_file}")
-                    os.remove(expired_path)
-            except (ValueError, OSError) as e:
-                # Invalid filename format or couldn't delete - skip
-                print(f"[GTFSManager] Warning: Invalid pickle file {pickle_file}: {e}")
+        return None
+
+    def _remove_old_pickles(self, keep: str) -> None:
+        """
+        Delete every pickle cache file except the given one.
+
+        Args:
+            keep: Filename of the pickle to keep
+        """
+        for _, pickle_file in self._list_pickles():
+            if pickle_file == keep:
                 continue
+            try:
+                print(f"[GTFSManager] Removing old pickle: {pickle_file}")
+                os.remove(os.path.join(self.cache_dir, pickle_file))
+            except OSError as e:
+                # Couldn't delete - skip
+                print(f"[GTFSManager] Warning: Could not remove pickle {pickle_file}: {e}")
 
-        return None
+    def _renew_pickle(self, pickle_path: str) -> str:
+        """
+        Extend an existing pickle's expiration without re-pickling it.
+
+        Args:
+            pickle_path: Path to the pickle to renew
+
+        Returns:
+            Path to the renamed pickle file
+        """
+        expiration_timestamp = int(time.time() + (self.cache_days * 86400))
+        suffix = ".pickle.zst" if pickle_path.endswith(".zst") else ".pickle"
+        pickle_filename = f"gtfs_feed_{expiration_timestamp}{suffix}"
+        renewed_path = os.path.join(self.cache_dir, pickle_filename)
+
+        os.replace(pickle_path, renewed_path)
+        self._remove_old_pickles(keep=pickle_filename)
+        print(f"[GTFSManager] Renewed pickled GTFS feed as {pickle_filename}")
+
+        return renewed_path
 
     def _save_pickle(self, feed) -> str:
         """
         Save GTFS feed to pickle file with expiration timestamp.
 
+        The lookup indexes built by _prepare_feed are stored with the feed,
+        so a warm start doesn't rebuild them. When zstandard is installed
+        the pickle is zstd-compressed (.pickle.zst), cutting the disk read
+        on startup.
+
         Args:
-            feed: GTFSKit feed object to pickle
+            feed: Prepared GTFSKit feed object to pickle
 
         Returns:
             Path to saved pickle file
@@ -173,32 +423,71 @@ class GTFSManager:
         expiration_timestamp = int(time.time() + (self.cache_days * 86400))
 
         # Create filename with expiration timestamp
-        pickle_filename = f"gtfs_feed_{expiration_timestamp}.pickle"
+        suffix = ".pickle.zst" if zstandard is not None else ".pickle"
+        pickle_filename = f"gtfs_feed_{expiration_timestamp}{suffix}"
         pickle_path = os.path.join(self.cache_dir, pickle_filename)
 
         print(f"[GTFSManager] Saving pickled GTFS feed to {pickle_filename}")
         print(f"[GTFSManager] Cache expires: {datetime.fromtimestamp(expiration_timestamp).strftime('%Y-%m-%d %H:%M:%S')}")
 
+        payload = {
+            'version': self.PICKLE_VERSION,
+            'feed': feed,
+            'trip_lookup': self._trip_lookup,
+            'schedule': self._schedule,
+            'stop_slices': self._stop_slices,
+        }
         with open(pickle_path, 'wb') as f:
-            pickle.dump(feed, f, protocol=pickle.HIGHEST_PROTOCOL)
+            if zstandard is not None:
+                with zstandard.ZstdCompressor(level=3, threads=-1).stream_writer(f) as writer:
+                    pickle.dump(payload, writer, protocol=pickle.HIGHEST_PROTOCOL)
+            else:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self._remove_old_pickles(keep=pickle_filename)
 
         return pickle_path
 
     def _load_pickle(self, pickle_path: str):
         """
-        Load GTFS feed from pickle file.
+        Load GTFS feed from pickle file and restore its lookup indexes.
+
+        Pickles from older versions (a bare feed, or indexes in an older
+        layout) are re-prepared after loading and saved again.
 
         Args:
             pickle_path: Path to pickle file
 
         Returns:
-            GTFSKit feed object
+            Prepared GTFSKit feed object
         """
         print(f"[GTFSManager] Loading pickled GTFS feed from {os.path.basename(pickle_path)}")
         start_time = time.time()
 
         with open(pickle_path, 'rb') as f:
-            feed = pickle.load(f)
+            if pickle_path.endswith(".zst"):
+                if zstandard is None:
+                    raise RuntimeError("zstandard is not installed, can't read compressed pickle")
+                with zstandard.ZstdDecompressor().stream_reader(f) as reader:
+                    payload = pickle.load(reader)
+            else:
+                payload = pickle.load(f)
+
+        if isinstance(payload, dict) and payload.get('version') == self.PICKLE_VERSION:
+            feed = payload['feed']
+            self._trip_lookup = payload['trip_lookup']
+            self._schedule = payload['schedule']
+            self._stop_slices = payload['stop_slices']
+        else:
+            feed = payload['feed'] if isinstance(payload, dict) else payload
+            print("[GTFSManager] Pickle predates current indexes, rebuilding")
+            self._prepare_feed(feed)
+
+            # Re-save so later starts get the current layout directly
+            try:
+                self._save_pickle(feed)
+            except Exception as e:
+                print(f"[GTFSManager] Warning: Could not save pickle cache: {e}")
 
         elapsed = time.time() - start_time
         print(f"[GTFSManager] Loaded pickled feed in {elapsed:.2f}s")
@@ -212,6 +501,9 @@ class GTFSManager:
         Uses pickle cache for fast loading (~1-2s vs ~60s parse time).
         Cache expiration is encoded in the pickle filename.
 
+        Safe to call from multiple threads: only one thread downloads and
+        parses, and the others wait for and share its result.
+
         Args:
             force_refresh: If True, download fresh data even if cached
 
@@ -222,12 +514,31 @@ class GTFSManager:
         if not force_refresh and self.feed is not None:
             return self.feed
 
+        with self._feed_lock:
+            # Another thread may have loaded it while we waited
+            if not force_refresh and self.feed is not None:
+                return self.feed
+            return self._read_static_feed(force_refresh)
+
+    def _read_static_feed(self, force_refresh: bool):
+        """
+        Load the static feed from pickle, or download and parse it.
+
+        Called by _load_static_feed with _feed_lock held.
+
+        Args:
+            force_refresh: If True, skip the pickle cache
+
+        Returns:
+            GTFSKit Feed object
+        """
         # Try to load from pickle cache (unless force refresh)
         if not force_refresh:
             pickle_path = self._get_pickle_path()
             if pickle_path:
                 try:
-                    self.feed = self._load_pickle(pickle_path)
+                    feed = self._load_pickle(pickle_path)
+                    self.feed = feed
                     self.last_static_update = datetime.now()
                     print(f"[GTFSManager] Loaded GTFS feed with {len(self.feed.routes)} routes")
                     return self.feed
@@ -236,23 +547,38 @@ class GTFSManager:
                     # Fall through to download fresh data
 
         # No valid pickle cache - download and parse fresh data
-        zip_path = self._download_static_feed()
-        extract_dir = os.path.join(self.cache_dir, "gtfs_extracted")
+        zip_path, downloaded = self._download_static_feed()
 
-        # Clean and recreate extraction directory
-        if os.path.exists(extract_dir):
-            shutil.rmtree(extract_dir)
-        os.makedirs(extract_dir)
+        # Unchanged feed already in memory (forced refresh): nothing to reparse
+        if not downloaded and self.feed is not None:
+            self.last_static_update = datetime.now()
+            return self.feed
 
-        # Extract ZIP
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
+        # Unchanged feed with an expired pickle parsed from this same ZIP:
+        # renew and load it instead of reparsing the CSVs
+        if not downloaded:
+            pickle_path = self._get_pickle_path(include_expired=True)
+            try:
+                if pickle_path and os.path.getmtime(pickle_path) >= os.path.getmtime(zip_path):
+                    pickle_path = self._renew_pickle(pickle_path)
+                    feed = self._load_pickle(pickle_path)
+                    self.feed = feed
+                    self.last_static_update = datetime.now()
+                    print(f"[GTFSManager] Loaded GTFS feed with {len(self.feed.routes)} routes")
+                    return self.feed
+            except Exception as e:
+                print(f"[GTFSManager] Error reusing pickle, will reparse: {e}")
+
+        # Extract only if this ZIP's contents haven't been extracted before
+        extract_dir = self._extract_static_feed(zip_path)
 
         # Load with GTFSKit (lazy import here)
         print("[GTFSManager] Loading GTFS data with GTFSKit...")
         start_time = time.time()
         gk = _get_gtfs_kit()
-        self.feed = gk.read_feed(extract_dir, dist_units='km')
+        feed = gk.read_feed(extract_dir, dist_units='km')
+        self._prepare_feed(feed)
+        self.feed = feed
         elapsed = time.time() - start_time
         self.last_static_update = datetime.now()
 
@@ -266,10 +592,128 @@ class GTFSManager:
 
         return self.feed
 
+    def _prepare_feed(self, feed) -> None:
+        """
+        Precompute derived columns and lookup indexes used by the query methods.
+
+        Runs once per fresh parse (or older pickle without saved indexes),
+        so per-request queries don't repeat the work. Columns already
+        present (e.g. from a pickle saved after preparation) are not
+        recomputed.
+
+        Args:
+            feed: GTFSKit feed object
+        """
+        import numpy as np
+        import pandas as pd
+
+        for table_name in self.UNUSED_TABLES:
+            if getattr(feed, table_name, None) is not None:
+                setattr(feed, table_name, None)
+
+        stop_times = feed.stop_times
+        if 'arrival_seconds' not in stop_times.columns:
+            # Convert arrival_time (HH:MM:SS) to seconds since midnight.
+            # GTFS times can be > 24:00:00 for trips past midnight.
+            # Malformed or missing times become NaN.
+            # Schedules repeat the same times heavily, so parse each distinct
+            # string once and broadcast back through the factorize codes.
+            codes, unique_times = pd.factorize(stop_times['arrival_time'], use_na_sentinel=False)
+            parts = pd.Series(unique_times, dtype=object).str.split(':', n=2, expand=True)
+            parts = parts.reindex(columns=range(3))
+            hours, minutes, seconds = (
+                pd.to_numeric(parts[i], errors='coerce').to_numpy(dtype='float64') for i in range(3)
+            )
+            # float32 holds whole seconds exactly (NaN marks bad times)
+            unique_seconds = (hours * 3600 + minutes * 60 + seconds).astype('float32')
+            stop_times['arrival_seconds'] = unique_seconds[codes]
+
+        # Keep only the columns the queries use, with repeated IDs and
+        # time strings as categoricals, to cut memory and speed up scans
+        stop_times = stop_times[['trip_id', 'stop_id', 'arrival_time', 'arrival_seconds']]
+        stop_times = stop_times.astype({
+            'trip_id': 'category', 'stop_id': 'category', 'arrival_time': 'category'
+        })
+        feed.stop_times = stop_times
+
+        trips = feed.trips
+        trips = trips.astype({
+            col: 'category'
+            for col in ('route_id', 'service_id', 'shape_id', 'block_id')
+            if col in trips.columns
+        })
+        if 'direction_id' in trips.columns:
+            trips['direction_id'] = pd.to_numeric(
+                trips['direction_id'], errors='coerce', downcast='integer'
+            )
+        feed.trips = trips
+
+        # Trips joined with route names, indexed by trip_id (first row wins,
+        # matching the old mask + iloc[0]). Routes missing from routes.txt
+        # fall back to their route_id for display.
+        trip_info = feed.trips.drop_duplicates('trip_id').merge(
+            feed.routes[['route_id', 'route_short_name']].drop_duplicates('route_id'),
+            on='route_id', how='left'
+        ).set_index('trip_id')
+        trip_info['route_short_name'] = trip_info['route_short_name'].fillna(trip_info['route_id'])
+        trip_info = trip_info.reindex(
+            columns=['route_id', 'route_short_name', 'direction_id', 'trip_headsign']
+        )
+
+        # trip_id -> (route_short_name, direction, headsign) for realtime-only
+        # trips: a plain dict lookup rather than a pandas .loc per trip
+        self._trip_lookup = dict(zip(
+            trip_info.index.tolist(),
+            zip(
+                trip_info['route_short_name'].astype(str).tolist(),
+                self._format_directions(trip_info['direction_id']).tolist(),
+                trip_info['trip_headsign'].tolist()
+            )
+        ))
+
+        # One schedule table sorted by (stop, arrival), held as plain column
+        # arrays with route/trip fields already joined in. Each stop maps to
+        # its contiguous slice, so a query is two binary searches plus a
+        # gather, with no DataFrame work per request. NaN times sort last.
+        # String columns are stored as (int32 codes, unique values) so the
+        # big per-row arrays are fixed-width buffers that pickle and load
+        # as raw memory instead of millions of object references.
+        table = stop_times.join(trip_info, on='trip_id').sort_values(
+            ['stop_id', 'arrival_seconds'], kind='stable', na_position='last'
+        )
+
+        def encode(values):
+            codes, uniques = pd.factorize(values, use_na_sentinel=False)
+            return codes.astype('int32'), np.asarray(uniques, dtype=object)
+
+        self._schedule = {
+            'arrival_seconds': table['arrival_seconds'].to_numpy(),
+            'route_id': encode(table['route_id'].to_numpy(dtype=object)),
+            'route_short_name': encode(table['route_short_name'].astype(str).to_numpy(dtype=object)),
+            'trip_id': encode(table['trip_id'].to_numpy(dtype=object)),
+            'direction': encode(self._format_directions(table['direction_id'])),
+            'headsign': encode(table['trip_headsign'].to_numpy(dtype=object)),
+        }
+
+        stop_codes = table['stop_id'].cat.codes.to_numpy(dtype='int64')
+        starts = np.r_[0, np.flatnonzero(np.diff(stop_codes)) + 1]
+        ends = np.r_[starts[1:], len(stop_codes)]
+        stop_categories = table['stop_id'].cat.categories
+        self._stop_slices = {
+            stop_categories[stop_codes[start]]: (int(start), int(end))
+            for start, end in zip(starts, ends)
+            if len(stop_codes) and stop_codes[start] >= 0
+        }
+
     def get_scheduled_arrivals(self, stop_id: str, window_minutes: int = 60) -> List[Dict[str, Any]]:
         """
         Get scheduled arrivals for a stop from GTFS static data.
 
+        Results are reused for repeat queries within the same wall-clock
+        minute (and the same feed load); callers get their own copies.
+        The cached query runs from the start of the minute with one extra
+        minute of look-ahead, and each call trims it to its own window.
+
         Args:
             stop_id: Stop ID to query
             window_minutes: Look ahead this many minutes (default: 60)
@@ -278,11 +722,58 @@ class GTFSManager:
             List of arrival dicts with keys: route_id, route_short_name, trip_id,
             direction_id, headsign, arrival_time (datetime), type="SC"
         """
-        # Ensure feed is loaded
-        feed = self._load_static_feed()
+        # Ensure feed (and its lookup indexes) is loaded
+        self._load_static_feed()
+
+        now = datetime.now().replace(microsecond=0)
+        minute_start = now.replace(second=0)
+        stamp = (minute_start, self.last_static_update)
+        key = (stop_id, window_minutes)
+        with self._scheduled_lock:
+            if stamp != self._scheduled_cache[0]:
+                self._scheduled_cache = (stamp, {})
+            # Keep the dict that matched this call's stamp: if the minute
+            # rolls over mid-query, the result lands in the old minute's
+            # dict rather than the new one
+            cache = self._scheduled_cache[1]
+            arrivals = cache.get(key)
+
+        if arrivals is None:
+            # Cover every call in this minute: from its first second to the
+            # window end of a call made in its last second
+            arrivals = self._query_scheduled_arrivals(
+                stop_id, window_minutes + 1, now=minute_start
+            )
+            with self._scheduled_lock:
+                cache[key] = arrivals
+
+        # Trim to this call's window. Copy so callers (e.g. merging, which
+        # adds minutes_until) can't alter the cache.
+        window_end = now + timedelta(minutes=window_minutes)
+        return [
+            dict(arrival) for arrival in arrivals
+            if now <= arrival['arrival_time'] <= window_end
+        ]
+
+    def _query_scheduled_arrivals(self, stop_id: str, window_minutes: int,
+                                  now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Compute scheduled arrivals for a stop from the prepared schedule arrays.
+
+        Args:
+            stop_id: Stop ID to query
+            window_minutes: Look ahead this many minutes
+            now: Start of the window (default: current time)
+
+        Returns:
+            List of arrival dicts (see get_scheduled_arrivals)
+        """
+        import numpy as np
+        import pandas as pd
 
         # Get current time
-        now = datetime.now()
+        if now is None:
+            now = datetime.now()
         current_time_seconds = now.hour * 3600 + now.minute * 60 + now.second
         window_end_seconds = current_time_seconds + (window_minutes * 60)
 
@@ -294,64 +785,62 @@ class GTFSManager:
         arrivals = []
 
         try:
-            # Get stop times for this stop
-            stop_times = feed.stop_times[feed.stop_times['stop_id'] == stop_id].copy()
+            # Get this stop's slice of the schedule (sorted by arrival_seconds)
+            stop_slice = self._stop_slices.get(stop_id)
 
-            if stop_times.empty:
+            if stop_slice is None:
                 print(f"[GTFSManager] Warning: No stop times found for stop {stop_id}")
                 return []
 
-            # Convert arrival_time to seconds since midnight
-            # GTFS times can be > 24:00:00 for trips past midnight
-            def parse_gtfs_time(time_str):
-                """Parse GTFS time string (HH:MM:SS) to seconds since midnight."""
-                if not isinstance(time_str, str):
-                    return None
-                parts = time_str.split(':')
-                if len(parts) != 3:
-                    return None
-                try:
-                    hours, minutes, seconds = map(int, parts)
-                    return hours * 3600 + minutes * 60 + seconds
-                except ValueError:
-                    return None
-
-            stop_times['arrival_seconds'] = stop_times['arrival_time'].apply(parse_gtfs_time)
-            stop_times = stop_times.dropna(subset=['arrival_seconds'])
-
-            # Filter to upcoming arrivals within window
-            # Note: This is simplified - doesn't handle trips past midnight well
-            upcoming = stop_times[
-                (stop_times['arrival_seconds'] >= current_time_seconds) &
-                (stop_times['arrival_seconds'] <= window_end_seconds)
-            ]
-
-            # Join with trips to get route and headsign
-            trips_df = feed.trips
-            upcoming = upcoming.merge(trips_df[['trip_id', 'route_id', 'direction_id', 'trip_headsign']],
-                                     on='trip_id', how='left')
-
-            # Join with routes to get route short name
-            routes_df = feed.routes
-            upcoming = upcoming.merge(routes_df[['route_id', 'route_short_name']],
-                                     on='route_id', how='left')
-
-            # Convert to arrival dicts
-            for _, row in upcoming.iterrows():
-                # Calculate arrival datetime
-                arrival_seconds = int(row['arrival_seconds'])
-                arrival_dt = now.replace(hour=0, minute=0, second=0, microsecond=0)
-                arrival_dt += timedelta(seconds=arrival_seconds)
-
-                # Extract direction (IB/OB)
-                direction = self._format_direction(row.get('direction_id'))
+            start, end = stop_slice
+            schedule = self._schedule
+            arrival_seconds = schedule['arrival_seconds'][start:end]
+
+            # Filter to upcoming arrivals within window by binary search on
+            # the sorted times. Also take yesterday's trips still running
+            # past midnight (times >= 24:00:00).
+            # NaN (unparseable) times sort last and are never in range.
+            today_lo = np.searchsorted(arrival_seconds, current_time_seconds, side='left')
+            today_hi = np.searchsorted(arrival_seconds, window_end_seconds, side='right')
+            late_lo = np.searchsorted(arrival_seconds, current_time_seconds + 86400, side='left')
+            late_hi = np.searchsorted(arrival_seconds, window_end_seconds + 86400, side='right')
+            late_lo = max(late_lo, today_hi)
+            late_hi = max(late_hi, late_lo)
+
+            if today_lo == today_hi and late_lo == late_hi:
+                return []
 
+            in_window = np.r_[today_lo:today_hi, late_lo:late_hi]
+            day_offsets = np.r_[
+                np.zeros(today_hi - today_lo), np.full(late_hi - late_lo, 86400.0)
+            ]
+            rows = in_window + start
+
+            # Calculate arrival datetimes for all rows at once
+            midnight = pd.Timestamp(now.replace(hour=0, minute=0, second=0, microsecond=0))
+            arrival_dts = (
+                midnight + pd.to_timedelta(arrival_seconds[in_window] - day_offsets, unit='s')
+            ).to_pydatetime()
+
+            def gather(column):
+                codes, uniques = schedule[column]
+                return uniques[codes[rows]].tolist()
+
+            # Convert to arrival dicts from the gathered column values
+            for route_id, route_short_name, trip_id, direction, headsign, arrival_dt in zip(
+                gather('route_id'),
+                gather('route_short_name'),
+                gather('trip_id'),
+                gather('direction'),
+                gather('headsign'),
+                arrival_dts
+            ):
                 arrivals.append({
-                    'route_id': row['route_id'],
-                    'route_short_name': str(row.get('route_short_name', row['route_id'])),
-                    'trip_id': row['trip_id'],
+                    'route_id': route_id,
+                    'route_short_name': route_short_name,
+                    'trip_id': trip_id,
                     'direction': direction,
-                    'headsign': row.get('trip_headsign', ''),
+                    'headsign': headsign,
                     'arrival_time': arrival_dt,
                     'type': 'SC'  # Scheduled
                 })
@@ -362,53 +851,157 @@ class GTFSManager:
 
         return arrivals
 
-    def get_realtime_arrivals(self, stop_id: str) -> List[Dict[str, Any]]:
+    def _fetch_realtime_feed(self) -> Dict[str, List[Tuple[str, Optional[str], datetime]]]:
         """
-        Get realtime arrivals from GTFS-Realtime feed.
+        Get the GTFS-Realtime arrivals indexed by stop, reusing a recent copy.
 
-        Args:
-            stop_id: Stop ID to query
+        Within REALTIME_TTL seconds of the last fetch the cached index is
+        returned as-is, so several stops polled back-to-back share one
+        download and parse. Once expired (but younger than REALTIME_MAX_AGE)
+        the cached index is still returned immediately while a background
+        thread revalidates it, keeping the network off the display path.
+        Only a first fetch, or a very stale cache, blocks the caller.
 
         Returns:
-            List of arrival dicts with keys: route_id, trip_id, arrival_time (datetime), type="TT"
+            Dict mapping stop_id to (trip_id, route_id, arrival_time) tuples
+
+        Raises:
+            requests.RequestException: If a blocking fetch fails
         """
-        arrivals = []
+        fetched_at, by_stop, _, _ = self._rt_cache
+        if by_stop is not None:
+            age = time.monotonic() - fetched_at
+            if age < self.REALTIME_TTL:
+                return by_stop
+            if age < self.REALTIME_MAX_AGE:
+                self._start_realtime_refresh()
+                return by_stop
+
+        return self._refresh_realtime_feed()
+
+    def _start_realtime_refresh(self) -> None:
+        """Start a background realtime refresh unless one is already running."""
+        with self._rt_lock:
+            if self._rt_refresh_thread is not None and self._rt_refresh_thread.is_alive():
+                return
+            self._rt_refresh_thread = threading.Thread(
+                target=self._background_realtime_refresh,
+                name="gtfs-rt-refresh",
+                daemon=True
+            )
+            self._rt_refresh_thread.start()
 
+    def _background_realtime_refresh(self) -> None:
+        """Thread target: refresh the realtime feed, logging any failure."""
         try:
-            # Fetch GTFS-Realtime feed
-            response = requests.get(self.realtime_url, timeout=10)
-            response.raise_for_status()
+            self._refresh_realtime_feed()
+        except Exception as e:
+            print(f"[GTFSManager] Background GTFS-Realtime refresh failed: {e}")
+
+    def _refresh_realtime_feed(self) -> Dict[str, List[Tuple[str, Optional[str], datetime]]]:
+        """
+        Fetch and index the GTFS-Realtime feed, revalidating the cached copy.
 
-            # Parse protobuf
-            feed = gtfs_realtime_pb2.FeedMessage()
-            feed.ParseFromString(response.content)
+        Sends a conditional GET when a previous index exists; a 304 keeps it.
+        The new cache entry is swapped in with a single assignment.
 
-            # Extract trip updates for this stop
-            for entity in feed.entity:
-                if not entity.HasField('trip_update'):
+        Returns:
+            Dict mapping stop_id to (trip_id, route_id, arrival_time) tuples
+
+        Raises:
+            requests.RequestException: If the fetch fails
+        """
+        _, by_stop, etag, last_modified = self._rt_cache
+        now = time.monotonic()
+
+        headers = {}
+        if by_stop is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = SESSION.get(self.realtime_url, headers=headers, timeout=10)
+        if response.status_code == 304 and headers:
+            self._rt_cache = (now, by_stop, etag, last_modified)
+            return by_stop
+        response.raise_for_status()
+
+        # Parse protobuf
+        feed = gtfs_realtime_pb2.FeedMessage()
+        feed.ParseFromString(response.content)
+
+        by_stop = self._index_realtime_feed(feed)
+        self._rt_cache = (
+            now, by_stop, response.headers.get('ETag'), response.headers.get('Last-Modified')
+        )
+        return by_stop
+
+    def _index_realtime_feed(self, feed) -> Dict[str, List[Tuple[str, Optional[str], datetime]]]:
+        """
+        Group a parsed realtime feed's arrivals by stop in a single pass.
+
+        Args:
+            feed: Parsed gtfs_realtime_pb2.FeedMessage
+
+        Returns:
+            Dict mapping stop_id to (trip_id, route_id, arrival_time) tuples
+        """
+        import numpy as np
+        import pandas as pd
+        from dateutil import tz
+
+        # Collect raw fields first; timestamps are converted in one batch below
+        stop_ids = []
+        trip_ids = []
+        route_ids = []
+        timestamps = []
+
+        for entity in feed.entity:
+            if not entity.HasField('trip_update'):
+                continue
+
+            trip_update = entity.trip_update
+            trip_id = trip_update.trip.trip_id
+            route_id = trip_update.trip.route_id if trip_update.trip.HasField('route_id') else None
+
+            # Check stop time updates
+            for stop_time_update in trip_update.stop_time_update:
+                # Get arrival time
+                if not stop_time_update.HasField('arrival'):
                     continue
 
-                trip_update = entity.trip_update
-                trip_id = trip_update.trip.trip_id
-                route_id = trip_update.trip.route_id if trip_update.trip.HasField('route_id') else None
+                stop_ids.append(stop_time_update.stop_id)
+                trip_ids.append(trip_id)
+                route_ids.append(route_id)
+                timestamps.append(stop_time_update.arrival.time)
 
-                # Check stop time updates
-                for stop_time_update in trip_update.stop_time_update:
-                    if stop_time_update.stop_id != stop_id:
-                        continue
+        # Epoch seconds -> naive local datetimes (same as datetime.fromtimestamp)
+        arrival_dts = pd.to_datetime(
+            np.asarray(timestamps, dtype='int64'), unit='s', utc=True
+        ).tz_convert(tz.tzlocal()).tz_localize(None).to_pydatetime()
 
-                    # Get arrival time
-                    if stop_time_update.HasField('arrival'):
-                        arrival_timestamp = stop_time_update.arrival.time
-                        arrival_dt = datetime.fromtimestamp(arrival_timestamp)
+        # Compact tuples rather than dicts: the index covers every stop in
+        # the feed, but only the queried stop's entries become dicts
+        by_stop = {}
+        for stop_id, trip_id, route_id, arrival_dt in zip(stop_ids, trip_ids, route_ids, arrival_dts):
+            by_stop.setdefault(stop_id, []).append((trip_id, route_id, arrival_dt))
 
-                        arrivals.append({
-                            'trip_id': trip_id,
-                            'route_id': route_id,
-                            'arrival_time': arrival_dt,
-                            'type': 'TT'  # TrueTime (realtime)
-                        })
+        return by_stop
 
+    def get_realtime_arrivals(self, stop_id: str) -> List[Dict[str, Any]]:
+        """
+        Get realtime arrivals from GTFS-Realtime feed.
+
+        Args:
+            stop_id: Stop ID to query
+
+        Returns:
+            List of arrival dicts with keys: route_id, trip_id, arrival_time (datetime), type="TT"
+        """
+        try:
+            # Fetch GTFS-Realtime feed (cached briefly between calls)
+            by_stop = self._fetch_realtime_feed()
         except requests.RequestException as e:
             print(f"[GTFSManager] Error fetching GTFS-Realtime: {e}")
             return []
@@ -416,9 +1009,18 @@ class GTFSManager:
             print(f"[GTFSManager] Error parsing GTFS-Realtime: {e}")
             return []
 
-        return arrivals
-
-    def get_merged_arrivals(self, stop_id: str, window_minutes: int = 60) -> List[Dict[str, Any]]:
+        return [
+            {
+                'trip_id': trip_id,
+                'route_id': route_id,
+                'arrival_time': arrival_dt,
+                'type': 'TT'  # TrueTime (realtime)
+            }
+            for trip_id, route_id, arrival_dt in by_stop.get(stop_id, ())
+        ]
+
+    def get_merged_arrivals(self, stop_id: str, window_minutes: int = 60,
+                            limit: Optional[int] = None) -> List[Dict[str, Any]]:
         """
         Get merged scheduled and realtime arrivals.
 
@@ -427,79 +1029,80 @@ class GTFSManager:
         Args:
             stop_id: Stop ID to query
             window_minutes: Look ahead window in minutes
+            limit: If set, return only this many soonest arrivals
 
         Returns:
             Sorted list of arrivals with all fields populated
         """
         # Get both scheduled and realtime
+        # (get_scheduled_arrivals also loads the static feed used below)
         scheduled = self.get_scheduled_arrivals(stop_id, window_minutes)
         realtime = self.get_realtime_arrivals(stop_id)
 
         # Create map of trip_id -> realtime arrival for quick lookup
         realtime_map = {a['trip_id']: a for a in realtime}
+        scheduled_trip_ids = {a['trip_id'] for a in scheduled}
 
-        # Merge: use realtime if available, otherwise scheduled
+        # Merge: use realtime if available, otherwise scheduled. Arrivals
+        # outside the window (or already past) are dropped as they're
+        # merged, with minutes until arrival computed in the same step.
+        now = datetime.now()
+        window_seconds = window_minutes * 60
         merged = []
-        scheduled_trip_ids = set()
 
         # Process scheduled arrivals
         for arrival in scheduled:
-            trip_id = arrival['trip_id']
-            scheduled_trip_ids.add(trip_id)
+            rt = realtime_map.get(arrival['trip_id'])
+            arrival_time = rt['arrival_time'] if rt is not None else arrival['arrival_time']
+            seconds_until = (arrival_time - now).total_seconds()
+            if not 0 <= seconds_until <= window_seconds:
+                continue
 
-            if trip_id in realtime_map:
+            if rt is not None:
                 # Use realtime data for this trip
-                rt = realtime_map[trip_id]
-                merged.append({
+                arrival = {
                     'route_short_name': arrival['route_short_name'],
                     'route_id': arrival['route_id'],
                     'direction': arrival['direction'],
                     'headsign': arrival['headsign'],
-                    'arrival_time': rt['arrival_time'],
+                    'arrival_time': arrival_time,
                     'type': 'TT',
-                    'trip_id': trip_id
-                })
-            else:
-                # Use scheduled data
-                merged.append(arrival)
+                    'trip_id': arrival['trip_id']
+                }
+            # Otherwise use scheduled data
+            arrival['minutes_until'] = int(seconds_until / 60)
+            merged.append(arrival)
 
         # Add any realtime arrivals that weren't in scheduled data
         for rt in realtime:
-            if rt['trip_id'] not in scheduled_trip_ids:
-                # Need to look up route info from feed
-                try:
-                    trip_info = self._get_trip_info(rt['trip_id'])
-                    merged.append({
-                        'route_short_name': trip_info.get('route_short_name', rt.get('route_id', '?')),
-                        'route_id': rt.get('route_id', '?'),
-                        'direction': trip_info.get('direction', ''),
-                        'headsign': trip_info.get('headsign', ''),
-                        'arrival_time': rt['arrival_time'],
-                        'type': 'TT',
-                        'trip_id': rt['trip_id']
-                    })
-                except Exception:
-                    # Skip if we can't get trip info
-                    pass
-
-        # Filter to window and future arrivals only
-        now = datetime.now()
-        cutoff = now + timedelta(minutes=window_minutes)
-        merged = [a for a in merged if now <= a['arrival_time'] <= cutoff]
-
-        # Sort by arrival time
-        merged.sort(key=lambda x: x['arrival_time'])
+            if rt['trip_id'] in scheduled_trip_ids:
+                continue
+            seconds_until = (rt['arrival_time'] - now).total_seconds()
+            if not 0 <= seconds_until <= window_seconds:
+                continue
 
-        # Calculate minutes until arrival
-        for arrival in merged:
-            minutes = int((arrival['arrival_time'] - now).total_seconds() / 60)
-            arrival['minutes_until'] = max(0, minutes)  # Don't show negative
+            # Need to look up route info from feed
+            try:
+                trip_info = self._get_trip_info(rt['trip_id'])
+                merged.append({
+                    'route_short_name': trip_info.get('route_short_name', rt.get('route_id', '?')),
+                    'route_id': rt.get('route_id', '?'),
+                    'direction': trip_info.get('direction', ''),
+                    'headsign': trip_info.get('headsign', ''),
+                    'arrival_time': rt['arrival_time'],
+                    'type': 'TT',
+                    'trip_id': rt['trip_id'],
+                    'minutes_until': int(seconds_until / 60)
+                })
+            except Exception:
+                # Skip if we can't get trip info
+                pass
 
         # Deduplicate arrivals with same route/direction/time
         # (e.g., multiple trip_ids for the same service)
-        # Keep TT (realtime) over SC (scheduled) when both exist
-        seen = {}
-        deduplicated = []
+        # Keep TT (realtime) over SC (scheduled) when both exist, otherwise
+        # the earliest. Done before ordering, so only survivors get sorted.
+        best = {}
 
         for arrival in merged:
             # Create key: (route, direction, minutes)
@@ -509,69 +1112,64 @@ class GTFSManager:
                 arrival['minutes_until']
             )
 
-            if key not in seen:
+            existing = best.get(key)
+            if existing is None:
                 # First time seeing this route/direction/time
-                seen[key] = arrival
-                deduplicated.append(arrival)
-            else:
+                best[key] = arrival
+            elif arrival['type'] != existing['type']:
                 # Duplicate found - prefer TT over SC
-                existing = seen[key]
-                if arrival['type'] == 'TT' and existing['type'] == 'SC':
-                    # Replace SC with TT
-                    deduplicated.remove(existing)
-                    deduplicated.append(arrival)
-                    seen[key] = arrival
-                # Otherwise keep the first one (already in list)
+                if arrival['type'] == 'TT':
+                    best[key] = arrival
+            elif arrival['arrival_time'] < existing['arrival_time']:
+                # Same type - keep the earlier one
+                best[key] = arrival
 
-        return deduplicated
+        # Sort by arrival time (partial sort when only the next few are wanted)
+        if limit is not None:
+            return heapq.nsmallest(limit, best.values(), key=itemgetter('arrival_time'))
+        return sorted(best.values(), key=itemgetter('arrival_time'))
 
     def _get_trip_info(self, trip_id: str) -> Dict[str, str]:
         """
         Look up trip information from GTFS static feed.
 
+        Does not load the feed itself; callers load it once up front rather
+        than per trip looked up.
+
         Args:
             trip_id: Trip ID to look up
 
         Returns:
             Dict with route_short_name, direction, headsign
+            (empty if the trip is unknown or no feed is loaded)
         """
-        feed = self._load_static_feed()
-
-        # Find trip
-        trip_row = feed.trips[feed.trips['trip_id'] == trip_id]
-        if trip_row.empty:
+        # Find trip (route name and direction already resolved at load)
+        trip = self._trip_lookup.get(trip_id)
+        if trip is None:
             return {}
 
-        trip = trip_row.iloc[0]
-        route_id = trip['route_id']
-
-        # Find route
-        route_row = feed.routes[feed.routes['route_id'] == route_id]
-        route_short_name = route_row.iloc[0]['route_short_name'] if not route_row.empty else route_id
-
+        route_short_name, direction, headsign = trip
         return {
-            'route_short_name': str(route_short_name),
-            'direction': self._format_direction(trip.get('direction_id')),
-            'headsign': trip.get('trip_headsign', '')
+            'route_short_name': route_short_name,
+            'direction': direction,
+            'headsign': headsign
         }
 
-    def _format_direction(self, direction_id) -> str:
+    def _format_directions(self, direction_ids):
         """
-        Format direction ID as IB/OB.
+        Format a column of direction IDs as IB/OB.
+
+        GTFS standard: 0 = outbound, 1 = inbound (but agencies vary).
+        For PRT, we'll use: 0 = OB, 1 = IB.
 
         Args:
-            direction_id: 0 or 1 from GTFS (or None)
+            direction_ids: pandas Series of GTFS direction IDs
 
         Returns:
-            'IB' or 'OB' or ''
+            numpy array of 'IB', 'OB' or '' (missing / non-numeric IDs)
         """
-        if direction_id is None or direction_id == '':
-            return ''
+        import numpy as np
+        import pandas as pd
 
-        try:
-            # GTFS standard: 0 = outbound, 1 = inbound (but agencies vary)
-            # For PRT, we'll use: 0 = OB, 1 = IB
-            direction_int = int(direction_id)
-            return 'IB' if direction_int == 1 else 'OB'
-        except (ValueError, TypeError):
-            return ''
+        ids = pd.to_numeric(direction_ids, errors='coerce').to_numpy(dtype='float64', na_value=np.nan)
+        return np.where(np.isnan(ids), '', np.where(ids == 1, 'IB', 'OB'))
@@ -0,0 +1,52 @@
+"""
+Shared HTTP session for trix-hub.
+
+Providers, the GTFS manager and the Matrix Portal client share one
+requests.Session so connections are pooled and kept alive across components.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
+
+
+# Hosts whose GETs are idempotent API reads and safe to retry.
+# trix-server POSTs are never retried, to avoid duplicate display frames.
+RETRY_PREFIXES = (
+    "https://api.open-meteo.com",
+    "https://air-quality-api.open-meteo.com",
+)
+
+
+def _create_session() -> requests.Session:
+    """
+    Create the shared session with tuned connection pooling.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    # Compressed transfer for API/feed downloads (explicit, not left to default)
+    session.headers['Accept-Encoding'] = 'gzip, deflate'
+
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    retry_adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=8,
+        max_retries=Retry(
+            total=2,
+            backoff_factor=0.2,
+            status_forcelist=[502, 503, 504],
+            allowed_methods=frozenset({"GET"})
+        )
+    )
+    for prefix in RETRY_PREFIXES:
+        session.mount(prefix, retry_adapter)
+
+    return session
+
+
+SESSION = _create_session()
@@ -7,7 +7,7 @@ and return renderer-agnostic DisplayData objects.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Any, Optional, Dict, TYPE_CHECKING
+from typing import Any, Callable, Hashable, Optional, Dict, TYPE_CHECKING
 from datetime import datetime, timedelta
 
 if TYPE_CHECKING:
@@ -40,12 +40,23 @@ class DataProvider(ABC):
 
     Providers fetch data from sources and return structured DisplayData objects.
     Includes built-in caching to avoid redundant fetches.
+
+    Providers that assemble DisplayData from independently changing parts can
+    also cache each part with its own TTL (see FIELD_TTLS and _get_cached_field).
     """
 
+    # Per-field cache durations in seconds, keyed by field name
+    FIELD_TTLS: Dict[str, int] = {}
+
+    # Whether the scheduler may fetch this provider's data ahead of its
+    # display. Providers whose content tracks the wall clock opt out.
+    PREFETCH: bool = True
+
     def __init__(self):
         """Initialize provider with empty cache"""
         self._cache: Optional[DisplayData] = None
         self._cache_expires: Optional[datetime] = None
+        self._field_cache: Dict[str, tuple[Any, datetime]] = {}
         self._condition_evaluator: Optional['ConditionEvaluator'] = None
 
     @abstractmethod
@@ -70,6 +81,38 @@ class DataProvider(ABC):
         """
         return timedelta(seconds=0)
 
+    def get_field_ttl(self, key: str) -> timedelta:
+        """
+        How long to cache an individual field fetched via _get_cached_field.
+
+        Args:
+            key: Field name
+
+        Returns:
+            timedelta for the field's cache duration (default: FIELD_TTLS entry, or 0)
+        """
+        return timedelta(seconds=self.FIELD_TTLS.get(key, 0))
+
+    def _get_cached_field(self, key: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get a field value, calling fetch() only if the cached value has expired.
+
+        Args:
+            key: Field name (looked up in FIELD_TTLS)
+            fetch: Callable returning a fresh value for the field
+
+        Returns:
+            Cached or freshly fetched value
+        """
+        now = datetime.now()
+        cached = self._field_cache.get(key)
+        if cached is not None and now < cached[1]:
+            return cached[0]
+
+        value = fetch()
+        self._field_cache[key] = (value, now + self.get_field_ttl(key))
+        return value
+
     def get_data(self, force_refresh: bool = False) -> DisplayData:
         """
         Get data, using cache if available and not expired.
@@ -82,6 +125,9 @@ class DataProvider(ABC):
         """
         now = datetime.now()
 
+        if force_refresh:
+            self._field_cache.clear()
+
         # Check if we can use cached data
         if not force_refresh and self._cache and self._cache_expires:
             if now < self._cache_expires:
@@ -102,6 +148,31 @@ class DataProvider(ABC):
         """Clear the cache, forcing next get_data() to fetch fresh data"""
         self._cache = None
         self._cache_expires = None
+        self._field_cache.clear()
+
+    def get_content_key(self, data: DisplayData) -> Optional[Hashable]:
+        """
+        Cheap key for the parts of data's content that affect rendering.
+
+        The scheduler reuses the last rendered bitmap when two fetches give
+        the same key. Return None (the default) when there is no cheap key;
+        such data is only reused when it's the very same object.
+
+        Args:
+            data: DisplayData returned by this provider
+
+        Returns:
+            Hashable key, or None
+        """
+        return None
+
+    def close(self):
+        """
+        Release background resources held by the provider.
+
+        Called by the scheduler on shutdown. Default implementation does nothing.
+        """
+        pass
 
     def should_run(self) -> bool:
         """
@@ -5,13 +5,46 @@ Fetches bus arrivals from GTFS static schedule and GTFS-Realtime feeds,
 merging them to show both scheduled (SC) and realtime (TT) predictions.
 """
 
+import heapq
+import threading
 from datetime import datetime, timedelta
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, Hashable, List, Optional, Tuple
 from .base import DataProvider, DisplayData
 from ..config import get_config
 from ..gtfs import get_gtfs_manager
 
 
+@lru_cache(maxsize=128)
+def _urgency_for(minutes: int) -> str:
+    """
+    Calculate urgency level for color coding.
+
+    Args:
+        minutes: Minutes until arrival
+
+    Returns:
+        'urgent' (red), 'soon' (yellow), or 'normal' (green)
+    """
+    if minutes <= 5:
+        return 'urgent'  # Red (0-5 mins)
+    elif minutes <= 10:
+        return 'soon'    # Yellow (6-10 mins)
+    else:
+        return 'normal'  # Green (11+ mins)
+
+
+class _Flight:
+    """A merged-arrivals query in progress, shared by concurrent callers."""
+
+    __slots__ = ('done', 'arrivals', 'error')
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.arrivals: Optional[List[dict]] = None
+        self.error: Optional[Exception] = None
+
+
 class BusArrivalProvider(DataProvider):
     """
     Provider for bus arrival predictions.
@@ -25,6 +58,12 @@ class BusArrivalProvider(DataProvider):
     - Automatic fallback to scheduled data if realtime unavailable
     """
 
+    # In-flight merged-arrival fetches shared by all providers, keyed by
+    # (static_url, realtime_url, stop_id, window_minutes). Concurrent callers
+    # for the same key wait for the first one instead of repeating the query.
+    _inflight: Dict[Tuple, '_Flight'] = {}
+    _inflight_lock = threading.Lock()
+
     def __init__(self, stop_id: str = None, priority_routes: List[str] = None,
                  gtfs_static_url: str = None, gtfs_realtime_url: str = None,
                  config_key: str = None, quiet: bool = False):
@@ -53,6 +92,8 @@ class BusArrivalProvider(DataProvider):
             raise ValueError("stop_id is required for BusArrivalProvider")
 
         self.priority_routes = priority_routes or config.get("priority_routes", [])
+        # Route -> position, so the sort key is a single dict lookup
+        self._priority_index = {route: i for i, route in enumerate(self.priority_routes)}
 
         # Get GTFS URLs
         self.gtfs_static_url = gtfs_static_url or config.get(
@@ -88,20 +129,14 @@ class BusArrivalProvider(DataProvider):
         """
         try:
             # Get merged arrivals from GTFS manager
-            arrivals = self.gtfs_manager.get_merged_arrivals(
-                stop_id=self.stop_id,
-                window_minutes=self.window_minutes
-            )
-
-            # Apply priority sorting
-            arrivals = self._sort_by_priority(arrivals)
+            arrivals = self._get_merged_arrivals()
 
-            # Limit to max arrivals
-            arrivals = arrivals[:self.max_arrivals]
+            # Apply priority sorting, keeping only the first max_arrivals
+            arrivals = self._sort_by_priority(arrivals, limit=self.max_arrivals)
 
             # Add urgency level for color coding
             for arrival in arrivals:
-                arrival['urgency'] = self._calculate_urgency(arrival['minutes_until'])
+                arrival['urgency'] = _urgency_for(arrival['minutes_until'])
 
             # Debug output - print arrivals to console
             if not self.quiet:
@@ -154,44 +189,95 @@ class BusArrivalProvider(DataProvider):
                 }
             )
 
-    def _sort_by_priority(self, arrivals: List[dict]) -> List[dict]:
+    def _get_merged_arrivals(self) -> List[dict]:
+        """
+        Get merged arrivals, sharing one GTFS query between concurrent callers.
+
+        If another provider is already fetching the same stop and window from
+        the same feeds, wait for its result rather than querying again.
+
+        Returns:
+            List of arrival dicts (a private copy for this caller)
+
+        Raises:
+            Exception: Whatever the shared GTFS query raised
+        """
+        key = (self.gtfs_static_url, self.gtfs_realtime_url,
+               self.stop_id, self.window_minutes)
+
+        cls = BusArrivalProvider
+        with cls._inflight_lock:
+            flight = cls._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                cls._inflight[key] = flight
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            # Callers annotate their own arrival dicts, so don't share them
+            return [dict(a) for a in flight.arrivals]
+
+        try:
+            flight.arrivals = self.gtfs_manager.get_merged_arrivals(
+                stop_id=self.stop_id,
+                window_minutes=self.window_minutes
+            )
+            return flight.arrivals
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            # Waiters hold the flight itself, so the key can go right away
+            with cls._inflight_lock:
+                del cls._inflight[key]
+            flight.done.set()
+
+    def _sort_by_priority(self, arrivals: List[dict],
+                          limit: Optional[int] = None) -> List[dict]:
         """
         Sort arrivals by time, with priority routes appearing before non-priority.
 
         Args:
             arrivals: List of arrival dicts
+            limit: If set, return only the first `limit` arrivals (selected
+                with a heap rather than sorting the whole list)
 
         Returns:
             Sorted list (priority routes first, all sorted by soonest arrival)
         """
-        def sort_key(arrival):
-            route = arrival['route_short_name']
-            minutes = arrival['minutes_until']
+        priority_index = self._priority_index
 
+        def sort_key(arrival):
             # Priority routes appear first, but sorted by time within group
-            if route in self.priority_routes:
-                return (0, minutes)  # Priority routes sorted by time
-            else:
-                return (1, minutes)  # Non-priority sorted by time
+            if arrival['route_short_name'] in priority_index:
+                return (0, arrival['minutes_until'])  # Priority routes sorted by time
+            return (1, arrival['minutes_until'])  # Non-priority sorted by time
 
+        if limit is not None:
+            return heapq.nsmallest(limit, arrivals, key=sort_key)
         return sorted(arrivals, key=sort_key)
 
-    def _calculate_urgency(self, minutes: int) -> str:
+    def get_content_key(self, data: DisplayData) -> Optional[Hashable]:
         """
-        Calculate urgency level for color coding.
+        Rendered output only depends on the error message or the shown
+        route, minutes, type and urgency of each arrival.
 
         Args:
-            minutes: Minutes until arrival
+            data: DisplayData returned by this provider
 
         Returns:
-            'urgent' (red), 'soon' (yellow), or 'normal' (green)
+            Hashable key for the rendered fields
         """
-        if minutes <= 5:
-            return 'urgent'  # Red (0-5 mins)
-        elif minutes <= 10:
-            return 'soon'    # Yellow (6-10 mins)
-        else:
-            return 'normal'  # Green (11+ mins)
+        content = data.content
+        if content.get("error"):
+            return ("error", content.get("error_message"))
+        return tuple(
+            (a.get('route_short_name'), a.get('minutes_until'), a.get('type'), a.get('urgency'))
+            for a in content.get("arrivals", [])
+        )
 
     def get_cache_duration(self) -> timedelta:
         """
@@ -5,22 +5,79 @@ Fetches random images from an S3 bucket and displays them on the LED matrix.
 Cycles through all images before repeating (list, randomize, iterate, repeat).
 """
 
+import hashlib
 import os
 import random
 import io
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime, timedelta
-from typing import Optional, List
+from typing import Any, Deque, Dict, Optional, List, Tuple
 
 import boto3
+from botocore.config import Config as BotoConfig
 from botocore.exceptions import ClientError, NoCredentialsError
 from PIL import Image
 
 from trixhub.providers.base import DataProvider, DisplayData
+from trixhub.utils.background import DaemonExecutor
 
 
 # Supported image extensions (lowercase)
 SUPPORTED_EXTENSIONS = {'.bmp', '.jpg', '.jpeg', '.png', '.gif', '.webp'}
 
+# Shared S3 clients, keyed by (region, access key, secret fingerprint).
+# boto3 clients are thread-safe once created, so providers with the same
+# credentials reuse one client (and its connection pool).
+_client_cache: Dict[Tuple[str, Optional[str], Optional[str]], Any] = {}
+_client_lock = threading.Lock()
+
+_CLIENT_CONFIG = BotoConfig(
+    max_pool_connections=16,
+    retries={'max_attempts': 3, 'mode': 'standard'}
+)
+
+
+def _get_s3_client(region: str, aws_access_key: Optional[str] = None,
+                   aws_secret_key: Optional[str] = None):
+    """
+    Get a shared S3 client for the given region and credentials.
+
+    Args:
+        region: AWS region name
+        aws_access_key: Access key ID (None to use the default credential chain)
+        aws_secret_key: Secret access key (None to use the default credential chain)
+
+    Returns:
+        boto3 S3 client
+    """
+    if aws_access_key and aws_secret_key:
+        # Key on a digest so the secret itself isn't kept as a dict key
+        secret_digest = hashlib.sha256(aws_secret_key.encode()).hexdigest()
+        key = (region, aws_access_key, secret_digest)
+    else:
+        key = (region, None, None)
+
+    # Creating clients from the default boto3 session isn't thread-safe
+    with _client_lock:
+        client = _client_cache.get(key)
+        if client is None:
+            if key[1] is not None:
+                client = boto3.client(
+                    's3',
+                    aws_access_key_id=aws_access_key,
+                    aws_secret_access_key=aws_secret_key,
+                    region_name=region,
+                    config=_CLIENT_CONFIG
+                )
+            else:
+                # Use default credential chain (IAM role, etc.)
+                client = boto3.client('s3', region_name=region, config=_CLIENT_CONFIG)
+            _client_cache[key] = client
+        return client
+
 
 class S3ImageProvider(DataProvider):
     """
@@ -61,17 +118,50 @@ class S3ImageProvider(DataProvider):
         # State for cycling through images
         self._image_keys: List[str] = []
         self._current_index: int = 0
+        # S3 ETag per key, from the bucket listing (used as the disk cache key)
+        self._etags: Dict[str, str] = {}
+
+        # Resized images are kept on disk keyed by ETag, so unchanged objects
+        # aren't downloaded and decoded again on every cycle
+        self.image_cache_dir = self.config.get("image_cache_dir")
+        if self.image_cache_dir is None:
+            # Prefer persistent location, fall back to temp
+            if os.path.exists("/app"):
+                self.image_cache_dir = "/app/cache/s3_images"
+            else:
+                self.image_cache_dir = os.path.join(tempfile.gettempdir(), "trix-hub-s3-images")
+        try:
+            os.makedirs(self.image_cache_dir, exist_ok=True)
+        except OSError as e:
+            print(f"[S3ImageProvider] Warning: Image cache disabled: {e}")
+            self.image_cache_dir = None
+
+        # Upcoming images are fetched and resized in the background so a
+        # display cycle only waits on S3 when the prefetch fell behind.
+        # Holds (key, Future) for the next keys in cycle order.
+        self.prefetch_count = max(0, int(self.config.get("prefetch_count", 2)))
+        self._prefetch: Deque[Tuple[str, Future]] = deque()
+        self._prefetch_executor: Optional[DaemonExecutor] = None
+        if self.prefetch_count:
+            # Daemon workers, so a download in flight never delays exit
+            self._prefetch_executor = DaemonExecutor(
+                max_workers=min(self.prefetch_count, 4),
+                thread_name_prefix="s3-prefetch"
+            )
 
         # Initialize S3 client
         self._init_s3_client()
 
         # Initial bucket listing
         self._refresh_image_list()
+        self._schedule_prefetch()
 
     def _init_s3_client(self):
         """
         Initialize boto3 S3 client with credentials from env vars or config.
 
+        Providers with the same region and credentials share one client.
+
         Preference order:
         1. AWS environment variables (AWS_ACCESS_KEY_ID, AWS_SECRET_ACCESS_KEY)
         2. Config.json credentials
@@ -86,16 +176,7 @@ class S3ImageProvider(DataProvider):
             aws_secret_key = self.config.get("aws_secret_access_key")
 
         try:
-            if aws_access_key and aws_secret_key:
-                self.s3_client = boto3.client(
-                    's3',
-                    aws_access_key_id=aws_access_key,
-                    aws_secret_access_key=aws_secret_key,
-                    region_name=self.region
-                )
-            else:
-                # Use default credential chain (IAM role, etc.)
-                self.s3_client = boto3.client('s3', region_name=self.region)
+            self.s3_client = _get_s3_client(self.region, aws_access_key, aws_secret_key)
 
             if not self.quiet:
                 print(f"[S3ImageProvider] Initialized S3 client for bucket: {self.bucket_name}")
@@ -140,6 +221,7 @@ class S3ImageProvider(DataProvider):
 
             # Collect image keys
             image_keys = []
+            etags = {}
             for page in pages:
                 if 'Contents' in page:
                     for obj in page['Contents']:
@@ -147,11 +229,15 @@ class S3ImageProvider(DataProvider):
                         # Skip directories (keys ending with /)
                         if not key.endswith('/') and self._is_supported_image(key):
                             image_keys.append(key)
+                            if obj.get('ETag'):
+                                etags[key] = obj['ETag'].strip('"')
 
             # Randomize order
             random.shuffle(image_keys)
 
+            self._clear_prefetch()
             self._image_keys = image_keys
+            self._etags = etags
             self._current_index = 0
 
             if not self.quiet:
@@ -186,6 +272,11 @@ class S3ImageProvider(DataProvider):
             # Load with PIL
             image = Image.open(io.BytesIO(image_data))
 
+            # For JPEGs, let the decoder scale down by up to 8x while decoding
+            # (no-op for other formats). Keeps at least twice the target size
+            # so the final resize still has detail to work with.
+            image.draft('RGB', (self.target_width * 2, self.target_height * 2))
+
             # Convert to RGB mode (required for BMP output)
             if image.mode != 'RGB':
                 image = image.convert('RGB')
@@ -234,6 +325,11 @@ class S3ImageProvider(DataProvider):
             new_width = self.target_width
             new_height = int(height * (new_width / width))
 
+        # Cheap in-place reduction of large images first, so the high-quality
+        # pass only works on a small image
+        if width > new_width * 2 and height > new_height * 2:
+            image.thumbnail((new_width * 2, new_height * 2), Image.Resampling.BILINEAR)
+
         # Resize with high-quality resampling
         image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
 
@@ -247,6 +343,112 @@ class S3ImageProvider(DataProvider):
 
         return image
 
+    def _get_cache_path(self, key: str) -> Optional[str]:
+        """
+        Get the disk cache path for an object's resized image.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            Path to the cached BMP, or None if caching is unavailable for key
+        """
+        etag = self._etags.get(key)
+        if not self.image_cache_dir or not etag:
+            return None
+        return os.path.join(
+            self.image_cache_dir,
+            f"{etag}_{self.target_width}x{self.target_height}.bmp"
+        )
+
+    def _load_image(self, key: str) -> Optional[Image.Image]:
+        """
+        Get an image resized to the target dimensions.
+
+        Uses the disk cache when the object's ETag is already cached,
+        otherwise fetches from S3, resizes, and caches the result.
+
+        Args:
+            key: S3 object key
+
+        Returns:
+            Resized PIL Image, or None if fetch/load fails
+        """
+        cache_path = self._get_cache_path(key)
+        if cache_path and os.path.exists(cache_path):
+            try:
+                with Image.open(cache_path) as cached:
+                    return cached.convert('RGB')
+            except Exception as e:
+                print(f"[S3ImageProvider] Warning: Ignoring unreadable cache file for {key}: {e}")
+
+        image = self._fetch_image_from_s3(key)
+        if image is None:
+            return None
+        image = self._resize_image(image)
+
+        if cache_path:
+            # Write to a temp file and rename, so a partial file is never read
+            tmp_path = f"{cache_path}.{threading.get_ident()}.tmp"
+            try:
+                image.save(tmp_path, 'BMP')
+                os.replace(tmp_path, cache_path)
+            except Exception as e:
+                print(f"[S3ImageProvider] Warning: Could not cache image {key}: {e}")
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
+        return image
+
+    def _schedule_prefetch(self):
+        """Start background loads for the next keys in the cycle, up to prefetch_count."""
+        if self._prefetch_executor is None:
+            return
+
+        next_index = self._current_index + len(self._prefetch)
+        while (len(self._prefetch) < self.prefetch_count
+               and next_index < len(self._image_keys)):
+            key = self._image_keys[next_index]
+            try:
+                future = self._prefetch_executor.submit(self._load_image, key)
+            except RuntimeError:
+                # Executor shut down (provider closed)
+                return
+            self._prefetch.append((key, future))
+            next_index += 1
+
+    def _clear_prefetch(self):
+        """Drop pending prefetches (e.g. after the key order changes)."""
+        while self._prefetch:
+            _, future = self._prefetch.popleft()
+            future.cancel()
+
+    def _take_image(self, key: str) -> Optional[Image.Image]:
+        """
+        Get the resized image for key, from the prefetch queue if it's next.
+
+        Args:
+            key: S3 object key about to be displayed
+
+        Returns:
+            Resized PIL Image, or None if fetch/load fails
+        """
+        if self._prefetch and self._prefetch[0][0] == key:
+            _, future = self._prefetch.popleft()
+            if not future.cancelled():
+                return future.result()
+        else:
+            self._clear_prefetch()
+        return self._load_image(key)
+
+    def close(self):
+        """Stop background prefetching."""
+        self._clear_prefetch()
+        if self._prefetch_executor is not None:
+            self._prefetch_executor.shutdown(cancel_futures=True)
+
     def fetch_data(self) -> DisplayData:
         """
         Fetch next image in cycle from S3.
@@ -275,13 +477,15 @@ class S3ImageProvider(DataProvider):
 
         # Get next image key
         key = self._image_keys[self._current_index]
-        self._current_index += 1
 
         if not self.quiet:
-            print(f"[S3ImageProvider] Fetching image {self._current_index}/{len(self._image_keys)}: {key}")
+            print(f"[S3ImageProvider] Fetching image {self._current_index + 1}/{len(self._image_keys)}: {key}")
 
-        # Fetch and process image
-        image = self._fetch_image_from_s3(key)
+        # Fetch and resize image (usually already done in the background),
+        # then queue up the ones after it
+        image = self._take_image(key)
+        self._current_index += 1
+        self._schedule_prefetch()
 
         if image is None:
             # Failed to fetch/load this image - try next one on next cycle
@@ -298,9 +502,6 @@ class S3ImageProvider(DataProvider):
                 }
             )
 
-        # Resize/crop to target dimensions
-        image = self._resize_image(image)
-
         # Return DisplayData with image
         return DisplayData(
             timestamp=datetime.now(),
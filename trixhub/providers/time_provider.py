@@ -5,6 +5,7 @@ Provides current time and date information in various formats.
 """
 
 from datetime import datetime, timedelta
+from typing import Dict, Hashable, Optional
 from .base import DataProvider, DisplayData
 
 
@@ -17,6 +18,17 @@ class TimeProvider(DataProvider):
     for typical LED matrix displays.
     """
 
+    # Fetched early, the time could show the previous minute for a whole display
+    PREFETCH = False
+
+    def __init__(self):
+        """Initialize provider with an empty formatted-string cache"""
+        super().__init__()
+        # Formatted strings only change once a minute, so keep the last set
+        # keyed by the minute they were formatted for
+        self._formatted_minute: Optional[datetime] = None
+        self._formatted: Dict[str, str] = {}
+
     def fetch_data(self) -> DisplayData:
         """
         Fetch current time and format for display.
@@ -26,11 +38,9 @@ class TimeProvider(DataProvider):
         """
         now = datetime.now()
 
-        return DisplayData(
-            timestamp=now,
-            content={
-                "type": "time",
-                "time": now,
+        minute = now.replace(second=0, microsecond=0)
+        if minute != self._formatted_minute:
+            self._formatted = {
                 "time_12h": now.strftime("%I:%M %p"),
                 "time_24h": now.strftime("%H:%M"),
                 "date": now.strftime("%Y-%m-%d"),
@@ -38,6 +48,15 @@ class TimeProvider(DataProvider):
                 "date_us": now.strftime("%m/%d/%Y"),
                 "day_of_week": now.strftime("%A"),
                 "day_of_week_short": now.strftime("%a"),
+            }
+            self._formatted_minute = minute
+
+        return DisplayData(
+            timestamp=now,
+            content={
+                "type": "time",
+                "time": now,
+                **self._formatted,
             },
             metadata={
                 "priority": "normal",
@@ -45,6 +64,18 @@ class TimeProvider(DataProvider):
             }
         )
 
+    def get_content_key(self, data: DisplayData) -> Optional[Hashable]:
+        """
+        Rendered output only depends on the formatted strings.
+
+        Args:
+            data: DisplayData returned by this provider
+
+        Returns:
+            Tuple of the formatted time/date strings
+        """
+        return (data.content.get("time_12h"), data.content.get("date_us"))
+
     def get_cache_duration(self) -> timedelta:
         """
         Cache time data for 30 seconds.
@@ -5,12 +5,20 @@ Fetches current weather and short-term forecast for configured location.
 """
 
 from datetime import datetime, timedelta
-from typing import Dict, Any
+from typing import Dict, Any, Hashable, Optional
 import requests
 import math
 
+# orjson parses straight from response bytes and is several times faster;
+# fall back to the stdlib if it isn't installed
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from .base import DataProvider, DisplayData
 from ..config import get_config
+from ..http import SESSION
 
 
 class WeatherProvider(DataProvider):
@@ -19,8 +27,28 @@ class WeatherProvider(DataProvider):
 
     Fetches current conditions and forecast for next N hours.
     No API key required.
+
+    Current conditions, AQI, and the hourly/daily forecast are cached
+    separately: the forecast models only update about hourly, so they are
+    refreshed less often than current conditions.
     """
 
+    WEATHER_URL = "https://api.open-meteo.com/v1/forecast"
+    AQI_URL = "https://air-quality-api.open-meteo.com/v1/air-quality"
+
+    # Default per-field cache durations in seconds, each overridable by the
+    # config key in FIELD_TTL_CONFIG_KEYS (see get_field_ttl)
+    FIELD_TTLS = {
+        "current": 600,
+        "air_quality": 600,
+        "forecast": 3600,
+    }
+    FIELD_TTL_CONFIG_KEYS = {
+        "current": "cache_duration",
+        "air_quality": "cache_duration",
+        "forecast": "forecast_cache_duration",
+    }
+
     # Weather code mapping (Open-Meteo WMO Weather interpretation codes)
     WEATHER_CONDITIONS = {
         0: "sunny",          # Clear sky
@@ -67,6 +95,12 @@ class WeatherProvider(DataProvider):
         # Get display mode (aqi_wind or lo_hi)
         self.mode = self.config.get("mode", "aqi_wind")
 
+        # HTTP validators and last payload per API field, for conditional requests
+        self._validators: Dict[str, tuple[Optional[str], Optional[str], Any]] = {}
+
+        # Last DisplayData built, returned again when nothing has changed
+        self._last_data: Optional[DisplayData] = None
+
     def fetch_data(self) -> DisplayData:
         """
         Fetch weather data from Open-Meteo API.
@@ -78,24 +112,8 @@ class WeatherProvider(DataProvider):
             requests.RequestException: If API call fails
         """
         try:
-            # Build weather API URL
-            weather_url = "https://api.open-meteo.com/v1/forecast"
-            weather_params = {
-                "latitude": self.latitude,
-                "longitude": self.longitude,
-                "current": "temperature_2m,weathercode,windspeed_10m,winddirection_10m",
-                "hourly": "temperature_2m,weathercode",
-                "daily": "sunrise,sunset,temperature_2m_min,temperature_2m_max",
-                "temperature_unit": self.units,
-                "windspeed_unit": "mph",
-                "forecast_days": 1,
-                "timezone": "auto"
-            }
-
-            # Fetch weather data
-            response = requests.get(weather_url, params=weather_params, timeout=10)
-            response.raise_for_status()
-            data = response.json()
+            current_data = self._get_cached_field("current", self._fetch_current)
+            data = self._get_cached_field("forecast", self._fetch_forecast)
 
             # Parse sunrise/sunset times
             sunrise_str = data["daily"]["sunrise"][0]
@@ -113,11 +131,11 @@ class WeatherProvider(DataProvider):
                 moon_phase = self._calculate_moon_phase(now)
 
             # Parse current weather
-            current_temp = int(round(data["current"]["temperature_2m"]))
-            current_code = data["current"]["weathercode"]
+            current_temp = int(round(current_data["temperature_2m"]))
+            current_code = current_data["weathercode"]
             current_condition = self._map_weather_code(current_code, is_night, moon_phase)
-            current_windspeed = int(round(data["current"]["windspeed_10m"]))
-            current_wind_direction = int(round(data["current"]["winddirection_10m"]))
+            current_windspeed = int(round(current_data["windspeed_10m"]))
+            current_wind_direction = int(round(current_data["winddirection_10m"]))
 
             # Parse hourly forecast data
             hourly_temps = data["hourly"]["temperature_2m"]
@@ -154,21 +172,12 @@ class WeatherProvider(DataProvider):
                     daily_min_temp = None
                     daily_max_temp = None
 
-            # Fetch AQI if in aqi_wind mode
+            # Fetch AQI if in aqi_wind mode. A failure isn't cached, so the
+            # next fetch retries; the rest of the display still shows.
             aqi_value = None
             if self.mode == "aqi_wind":
                 try:
-                    aqi_url = "https://air-quality-api.open-meteo.com/v1/air-quality"
-                    aqi_params = {
-                        "latitude": self.latitude,
-                        "longitude": self.longitude,
-                        "current": "us_aqi",
-                        "timezone": "auto"
-                    }
-                    aqi_response = requests.get(aqi_url, params=aqi_params, timeout=10)
-                    aqi_response.raise_for_status()
-                    aqi_data = aqi_response.json()
-                    aqi_value = int(round(aqi_data["current"]["us_aqi"]))
+                    aqi_value = self._get_cached_field("air_quality", self._fetch_aqi)
                 except (requests.RequestException, KeyError, ValueError, TypeError):
                     aqi_value = None
 
@@ -186,36 +195,45 @@ class WeatherProvider(DataProvider):
                     "hi": daily_max_temp
                 }
 
-            return DisplayData(
-                timestamp=datetime.now(),
-                content={
-                    "type": "weather",
-                    "location": self.location_name,
-                    "current": {
-                        "temperature": current_temp,
-                        "condition": current_condition,
-                        "units": self.units,
-                        "time_label": current_time_label,
-                        **current_row_data
-                    },
-                    "forecast1": {
-                        "temperature": forecast1_temp,
-                        "condition": forecast1_condition,
-                        "hours_ahead": self.forecast_interval_hours,
-                        "time_label": forecast1_time_label
-                    },
-                    "forecast2": {
-                        "temperature": forecast2_temp,
-                        "condition": forecast2_condition,
-                        "hours_ahead": self.forecast_interval_hours * 2,
-                        "time_label": forecast2_time_label
-                    }
+            content = {
+                "type": "weather",
+                "location": self.location_name,
+                "current": {
+                    "temperature": current_temp,
+                    "condition": current_condition,
+                    "units": self.units,
+                    "time_label": current_time_label,
+                    **current_row_data
+                },
+                "forecast1": {
+                    "temperature": forecast1_temp,
+                    "condition": forecast1_condition,
+                    "hours_ahead": self.forecast_interval_hours,
+                    "time_label": forecast1_time_label
                 },
+                "forecast2": {
+                    "temperature": forecast2_temp,
+                    "condition": forecast2_condition,
+                    "hours_ahead": self.forecast_interval_hours * 2,
+                    "time_label": forecast2_time_label
+                }
+            }
+
+            # Nothing changed: reuse the previous content dict, but stamp a new
+            # DisplayData so freshness checks (e.g. scheduler prefetch) see
+            # when it was fetched
+            if self._last_data is not None and self._last_data.content == content:
+                content = self._last_data.content
+
+            self._last_data = DisplayData(
+                timestamp=datetime.now(),
+                content=content,
                 metadata={
                     "priority": "normal",
                     "suggested_display_duration": 30,
                 }
             )
+            return self._last_data
 
         except (requests.RequestException, KeyError, ValueError) as e:
             # Return error data if API call fails
@@ -233,6 +251,97 @@ class WeatherProvider(DataProvider):
                 }
             )
 
+    def _get_json(self, field: str, url: str, params: Dict[str, Any]) -> Any:
+        """
+        GET a JSON payload, revalidating the previous response if there is one.
+
+        Sends If-None-Match / If-Modified-Since from the last response for this
+        field; on 304 Not Modified the previously parsed payload is returned.
+
+        Args:
+            field: Field name the payload belongs to
+            url: API endpoint
+            params: Query parameters
+
+        Returns:
+            Parsed JSON payload
+        """
+        etag, last_modified, payload = self._validators.get(field, (None, None, None))
+        headers = {}
+        if payload is not None:
+            if etag:
+                headers['If-None-Match'] = etag
+            if last_modified:
+                headers['If-Modified-Since'] = last_modified
+
+        response = SESSION.get(url, params=params, headers=headers, timeout=10)
+        if response.status_code == 304 and payload is not None:
+            return payload
+        response.raise_for_status()
+
+        payload = json_loads(response.content)
+        self._validators[field] = (
+            response.headers.get('ETag'),
+            response.headers.get('Last-Modified'),
+            payload
+        )
+        return payload
+
+    def _fetch_current(self) -> Dict[str, Any]:
+        """
+        Fetch current conditions from Open-Meteo.
+
+        Returns:
+            The "current" section of the API response
+        """
+        params = {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "current": "temperature_2m,weathercode,windspeed_10m,winddirection_10m",
+            "temperature_unit": self.units,
+            "windspeed_unit": "mph",
+            "timezone": "auto"
+        }
+        return self._get_json("current", self.WEATHER_URL, params)["current"]
+
+    def _fetch_forecast(self) -> Dict[str, Any]:
+        """
+        Fetch hourly and daily forecast from Open-Meteo.
+
+        Returns:
+            API response with "hourly" and "daily" sections
+        """
+        params = {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "hourly": "temperature_2m,weathercode",
+            "daily": "sunrise,sunset,temperature_2m_min,temperature_2m_max",
+            "temperature_unit": self.units,
+            "forecast_days": 1,
+            "timezone": "auto"
+        }
+        return self._get_json("forecast", self.WEATHER_URL, params)
+
+    def _fetch_aqi(self) -> int:
+        """
+        Fetch current US AQI from the Open-Meteo air quality API.
+
+        Returns:
+            AQI value
+
+        Raises:
+            requests.RequestException: If API call fails
+            KeyError, ValueError, TypeError: If the response has no usable AQI
+        """
+        params = {
+            "latitude": self.latitude,
+            "longitude": self.longitude,
+            "current": "us_aqi",
+            "timezone": "auto"
+        }
+        data = self._get_json("air_quality", self.AQI_URL, params)
+        return int(round(data["current"]["us_aqi"]))
+
     def _map_weather_code(self, code: int, is_night: bool = False, moon_phase: float = None) -> str:
         """
         Map Open-Meteo weather code to internal condition name.
@@ -316,6 +425,22 @@ class WeatherProvider(DataProvider):
         else:
             return f"{hour - 12}p"
 
+    def get_content_key(self, data: DisplayData) -> Optional[Hashable]:
+        """
+        Key on the content's (small, flat) sections, so unchanged weather
+        reuses the last rendered bitmap.
+
+        Args:
+            data: DisplayData returned by this provider
+
+        Returns:
+            Hashable key for the content
+        """
+        return tuple(
+            (key, tuple(sorted(value.items())) if isinstance(value, dict) else value)
+            for key, value in sorted(data.content.items())
+        )
+
     def get_cache_duration(self) -> timedelta:
         """
         Cache weather data for configured duration (default: 10 minutes).
@@ -327,3 +452,21 @@ class WeatherProvider(DataProvider):
         """
         cache_seconds = self.config.get("cache_duration", 600)
         return timedelta(seconds=cache_seconds)
+
+    def get_field_ttl(self, key: str) -> timedelta:
+        """
+        Cache duration for an individual API field.
+
+        Current conditions and AQI follow cache_duration; the forecast uses
+        forecast_cache_duration. Unset keys fall back to FIELD_TTLS.
+
+        Args:
+            key: Field name ("current", "air_quality", or "forecast")
+
+        Returns:
+            Cache duration
+        """
+        config_key = self.FIELD_TTL_CONFIG_KEYS.get(key)
+        if config_key is not None:
+            return timedelta(seconds=self.config.get(config_key, self.FIELD_TTLS[key]))
+        return super().get_field_ttl(key)
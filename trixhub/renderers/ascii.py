@@ -74,6 +74,21 @@ class ASCIIRenderer(Renderer):
         # Convert image to colored ASCII
         return self._image_to_ascii(img)
 
+    def render_image(self, img: Image.Image) -> str:
+        """
+        Render an already-rendered bitmap to colored ASCII art string.
+
+        Lets callers that also need the bitmap (e.g. to post it) render
+        the frame once and reuse it for the terminal preview.
+
+        Args:
+            img: PIL Image from BitmapRenderer
+
+        Returns:
+            Multi-line colored ASCII art string using half-block technique
+        """
+        return self._image_to_ascii(img)
+
     def _image_to_ascii(self, img: Image.Image) -> str:
         """
         Convert PIL Image to colored ASCII using half-block technique.
@@ -98,7 +113,7 @@ class ASCIIRenderer(Renderer):
 
         # Process image in pairs of rows (each pair becomes one terminal row)
         for row_pair in range(0, self.height, 2):
-            line = ""
+            cells = []
 
             for col in range(self.width):
                 # Get top and bottom pixels
@@ -112,13 +127,13 @@ class ASCIIRenderer(Renderer):
 
                 # Create colored character
                 if self.true_color:
-                    line += self._rgb_half_block(top_pixel, bottom_pixel)
+                    cells.append(self._rgb_half_block(top_pixel, bottom_pixel))
                 else:
-                    line += self._256_half_block(top_pixel, bottom_pixel)
+                    cells.append(self._256_half_block(top_pixel, bottom_pixel))
 
             # Reset color at end of line
-            line += self.RESET
-            output_lines.append(line)
+            cells.append(self.RESET)
+            output_lines.append("".join(cells))
 
         return "\n".join(output_lines)
 
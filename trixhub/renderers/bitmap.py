@@ -47,6 +47,9 @@ class BitmapRenderer(Renderer):
 
         self.font_path = font_path
 
+        # Loaded fonts by size; parsing the TrueType file on every render is slow
+        self._fonts = {}
+
     def render(self, data: DisplayData) -> Image.Image:
         """
         Render DisplayData to PIL Image.
@@ -107,12 +110,8 @@ class BitmapRenderer(Renderer):
         content_bottom = self.height - 3  # 29
 
         # Load fonts
-        if self.font_path:
-            time_font = ImageFont.truetype(self.font_path, 12)
-            date_font = ImageFont.truetype(self.font_path, 8)
-        else:
-            time_font = ImageFont.load_default()
-            date_font = ImageFont.load_default()
+        time_font = self.get_font(12)
+        date_font = self.get_font(8)
 
         # Get time string
         time_str = data.content.get("time_12h", "??:??")
@@ -173,20 +172,14 @@ class BitmapRenderer(Renderer):
         if data.content.get("error"):
             error_msg = data.content.get("error_message", "Weather API error 😢")
             # Load font
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, 10)
-            else:
-                font = ImageFont.load_default()
+            font = self.get_font(10)
             # Draw error message centered
             x, y = center_text(error_msg, font, self.width, self.height)
             draw.text((x, y), error_msg, fill='red', font=font)
             return img
 
         # Load fonts (reduced to size 8 to fit temp + AQI + wind)
-        if self.font_path:
-            text_font = ImageFont.truetype(self.font_path, 8)
-        else:
-            text_font = ImageFont.load_default()
+        text_font = self.get_font(8)
 
         # Get weather data
         current = data.content.get("current", {})
@@ -253,10 +246,7 @@ class BitmapRenderer(Renderer):
         img.paste(forecast2_icon, (icon3_x, icon_y))
 
         # Middle row: time labels (font size 7)
-        if self.font_path:
-            time_font = ImageFont.truetype(self.font_path, 7)
-        else:
-            time_font = ImageFont.load_default()
+        time_font = self.get_font(7)
         time_y = 12
         time1_width = draw.textlength(current_time_label, font=time_font)
         time1_x = icon1_x + (12 - time1_width) // 2
@@ -339,10 +329,7 @@ class BitmapRenderer(Renderer):
             error_msg = data.content.get("error_message", "Bus data error")
 
             # Load font
-            if self.font_path:
-                font = ImageFont.truetype(self.font_path, 8)
-            else:
-                font = ImageFont.load_default()
+            font = self.get_font(8)
 
             # Draw error message centered
             x, y = center_text(error_msg, font, self.width, self.height)
@@ -351,10 +338,7 @@ class BitmapRenderer(Renderer):
             return img
 
         # Load font (size 8 for compact display)
-        if self.font_path:
-            font = ImageFont.truetype(self.font_path, 8)
-        else:
-            font = ImageFont.load_default()
+        font = self.get_font(8)
 
         # Get arrivals
         arrivals = data.content.get("arrivals", [])
@@ -472,10 +456,7 @@ class BitmapRenderer(Renderer):
         draw = ImageDraw.Draw(img)
 
         # Load font
-        if self.font_path:
-            font = ImageFont.truetype(self.font_path, 8)
-        else:
-            font = ImageFont.load_default()
+        font = self.get_font(8)
 
         # Draw error message
         error_text = f"ERROR:\n{message}"
@@ -495,7 +476,11 @@ class BitmapRenderer(Renderer):
         Returns:
             ImageFont object
         """
-        if self.font_path:
-            return ImageFont.truetype(self.font_path, size)
-        else:
-            return ImageFont.load_default()
+        font = self._fonts.get(size)
+        if font is None:
+            if self.font_path:
+                font = ImageFont.truetype(self.font_path, size)
+            else:
+                font = ImageFont.load_default()
+            self._fonts[size] = font
+        return font
@@ -5,13 +5,19 @@ Creates simple geometric weather icons suitable for LED matrix display.
 Supports 12x12 and 14x14 sizes.
 """
 
+from functools import lru_cache
+
 from PIL import Image, ImageDraw
 
 
+@lru_cache(maxsize=64)
 def draw_weather_icon(condition: str, size: int = 12) -> Image.Image:
     """
     Draw a weather icon for the given condition.
 
+    Icons are cached, so the returned image is shared and must not be
+    modified by callers (pasting it onto another image is fine).
+
     Args:
         condition: Weather condition (sunny, cloudy, rainy, etc.)
         size: Icon size in pixels (12 or 14)
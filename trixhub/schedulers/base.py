@@ -4,15 +4,24 @@ Base scheduler class for trix-hub.
 Provides common functionality for all scheduler modes.
 """
 
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from datetime import datetime
-from typing import Dict, Any
+from functools import partial
+from typing import Dict, Any, Optional
 
 from trixhub.config import get_config
 from trixhub.providers import TimeProvider, WeatherProvider, BusArrivalProvider, DataProvider
 from trixhub.providers.s3_image_provider import S3ImageProvider
 from trixhub.renderers import BitmapRenderer, ASCIIRenderer
-from trixhub.client import MatrixClient
+from trixhub.utils.background import DaemonExecutor
+
+
+# Log separator lines, built once rather than on every print
+SEPARATOR = "=" * 70
+DEBUG_SEPARATOR = "─" * 70
 
 
 class BaseScheduler(ABC):
@@ -23,6 +32,9 @@ class BaseScheduler(ABC):
     and matrix communication. Subclasses implement specific scheduling logic.
     """
 
+    # Seconds before a display ends to start fetching the next provider's data
+    PREFETCH_LEAD = 2
+
     def __init__(self, debug: bool = False, quiet: bool = False):
         """
         Initialize scheduler with configuration and components.
@@ -32,7 +44,9 @@ class BaseScheduler(ABC):
             quiet: If True, reduce logging output to minimize SD card wear
         """
         self.config = get_config()
-        self.shutdown_requested = False
+        self._shutdown_event = threading.Event()
+        # (epoch second, formatted string) from the last _timestamp() call
+        self._ts_cache = (None, "")
         self.debug = debug
         self.quiet = quiet
 
@@ -54,12 +68,15 @@ class BaseScheduler(ABC):
             self.client = None
             self.renderer = None
         else:
-            # Normal mode: use bitmap renderer and matrix client
+            # Normal mode: use bitmap renderer and matrix client.
+            # Imported here so debug mode never loads the HTTP client stack.
+            from trixhub.client import MatrixClient
             self.client = MatrixClient(
                 server_hostname=self.matrix_config.get("server_hostname", "http://trix-server.local"),
                 width=self.matrix_config.get("width", 64),
                 height=self.matrix_config.get("height", 32),
-                output_dir=self.matrix_config.get("output_dir", "output")
+                output_dir=self.matrix_config.get("output_dir", "output"),
+                wire_format=self.matrix_config.get("wire_format", "bmp")
             )
             self.renderer = BitmapRenderer(
                 width=self.matrix_config.get("width", 64),
@@ -67,6 +84,18 @@ class BaseScheduler(ABC):
             )
             self.ascii_renderer = None
 
+        # Last (DisplayData, content key, bitmap) rendered per provider, to skip
+        # re-rendering when a provider's data hasn't changed
+        self._last_render: Dict[str, tuple] = {}
+
+        # Next provider's data is fetched in the background near the end of
+        # the current display. Futures are kept per provider until that
+        # provider is displayed, since fetching can advance provider state
+        # (e.g. the S3 image cursor) and must not be thrown away. Daemon
+        # workers, so an in-flight fetch never delays process exit.
+        self._prefetch_executor = DaemonExecutor(max_workers=1, thread_name_prefix="prefetch")
+        self._prefetched: Dict[str, Future] = {}
+
         # Initialize providers
         self.providers: Dict[str, DataProvider] = {}
         self._init_providers()
@@ -122,6 +151,115 @@ class BaseScheduler(ABC):
             except Exception as e:
                 print(f"[Scheduler] Error initializing provider '{provider_name}': {e}")
 
+    def _log_post(self, provider_name: str, success: bool) -> None:
+        """
+        Log the outcome of a background bitmap post.
+
+        Args:
+            provider_name: Name of provider the bitmap was rendered for
+            success: Whether the post succeeded
+        """
+        if success:
+            if not self.quiet:
+                print(f"[{self._timestamp()}] ✓ Successfully posted bitmap for '{provider_name}'")
+        else:
+            # Always log failures
+            print(f"[{self._timestamp()}] ✗ Failed to post bitmap for '{provider_name}'")
+
+    def _render_cached(self, provider_name: str, data: Any):
+        """
+        Render data to a bitmap, reusing the provider's last bitmap if unchanged.
+
+        Data is considered unchanged if it's the same object as last time
+        (served from the provider's cache) or the provider gives the same
+        content key for it (see DataProvider.get_content_key).
+
+        Args:
+            provider_name: Name of provider the data came from
+            data: DisplayData to render
+
+        Returns:
+            PIL Image
+        """
+        last = self._last_render.get(provider_name)
+        if last is not None and last[0] is data:
+            return last[2]
+
+        provider = self.providers.get(provider_name)
+        key = provider.get_content_key(data) if provider is not None else None
+        if key is not None and last is not None and last[1] == key:
+            bitmap = last[2]
+        else:
+            bitmap = self.renderer.render(data)
+
+        self._last_render[provider_name] = (data, key, bitmap)
+        return bitmap
+
+    def _start_prefetch(self, provider_name: str) -> None:
+        """
+        Start fetching a provider's data in the background.
+
+        Args:
+            provider_name: Name of provider that will be displayed next
+        """
+        provider = self.providers.get(provider_name)
+        if provider is None or not provider.PREFETCH or not provider.should_run():
+            return
+        if provider_name in self._prefetched:
+            # Still holding an unconsumed prefetch for this provider
+            return
+        try:
+            self._prefetched[provider_name] = self._prefetch_executor.submit(provider.get_data)
+        except RuntimeError:
+            # Scheduler closed
+            pass
+
+    def _take_prefetched(self, provider_name: str) -> Optional[Any]:
+        """
+        Consume prefetched data for a provider, if any.
+
+        Prefetched data is kept until its provider is next displayed (e.g.
+        across a rotation switch). For providers that cache, data older than
+        the cache duration is dropped so get_data() fetches fresh; providers
+        without a cache (each fetch advances to a new item) always use it.
+
+        Args:
+            provider_name: Name of provider about to be displayed
+
+        Returns:
+            DisplayData, or None if nothing usable was prefetched for this provider
+
+        Raises:
+            Exception: Whatever the provider's get_data() raised
+        """
+        future = self._prefetched.pop(provider_name, None)
+        if future is None:
+            return None
+        data = future.result()
+
+        cache_duration = self.providers[provider_name].get_cache_duration()
+        if cache_duration.total_seconds() > 0 and datetime.now() - data.timestamp >= cache_duration:
+            return None
+        return data
+
+    def _wait_display(self, duration: int, next_provider: str = None) -> None:
+        """
+        Wait out a display, prefetching the next provider shortly before it ends.
+
+        Args:
+            duration: Display duration in seconds
+            next_provider: Name of provider that will be displayed next, if known
+        """
+        if next_provider is None:
+            self._shutdown_event.wait(timeout=duration)
+            return
+
+        lead = min(self.PREFETCH_LEAD, duration)
+        if self._shutdown_event.wait(timeout=duration - lead):
+            return
+        self._start_prefetch(next_provider)
+        self._shutdown_event.wait(timeout=lead)
+
     def _get_provider_list(self):
         """
         Get list of providers to initialize.
@@ -164,13 +302,16 @@ class BaseScheduler(ABC):
         # Fall back to default
         return self.default_duration
 
-    def _display_provider(self, provider_name: str, duration_override: int = None) -> bool:
+    def _display_provider(self, provider_name: str, duration_override: int = None,
+                          next_provider: str = None) -> bool:
         """
         Fetch data from provider, render it, and display/post.
 
         Args:
             provider_name: Name of provider to display
             duration_override: Optional duration override (in seconds)
+            next_provider: Name of provider that will be displayed next, so its
+                data can be prefetched before this display ends
 
         Returns:
             True if successful, False if error occurred
@@ -190,28 +331,27 @@ class BaseScheduler(ABC):
             return False
 
         try:
-            # Fetch data from provider (respects cache)
-            data = provider.get_data()
+            # Use data prefetched during the previous display, otherwise
+            # fetch from provider (respects cache)
+            data = self._take_prefetched(provider_name)
+            if data is None:
+                data = provider.get_data()
 
             if self.debug:
                 # Debug mode: render ASCII and print to console
                 ascii_output = self.ascii_renderer.render(data)
                 print()
-                print("─" * 70)
+                print(DEBUG_SEPARATOR)
                 print(ascii_output)
-                print("─" * 70)
+                print(DEBUG_SEPARATOR)
                 print()
             else:
-                # Normal mode: render bitmap and post to matrix
-                bitmap = self.renderer.render(data)
-                success = self.client.post_bitmap(bitmap)
-
-                if success:
-                    if not self.quiet:
-                        print(f"[{self._timestamp()}] ✓ Successfully posted bitmap for '{provider_name}'")
-                else:
-                    # Always log failures
-                    print(f"[{self._timestamp()}] ✗ Failed to post bitmap for '{provider_name}'")
+                # Normal mode: render bitmap and post it in the background so
+                # the HTTP round-trip overlaps the display wait. Unchanged data
+                # reuses the last bitmap; the client skips the post if the
+                # panel is already showing it.
+                bitmap = self._render_cached(provider_name, data)
+                self.client.post_bitmap_async(bitmap, callback=partial(self._log_post, provider_name))
 
             # Get display duration and sleep
             duration = self._get_display_duration(provider_name, data, duration_override)
@@ -219,12 +359,8 @@ class BaseScheduler(ABC):
                 print(f"[{self._timestamp()}] Displaying for {duration}s...")
                 print()
 
-            # Sleep in 1-second intervals to allow quick shutdown
-            import time
-            for _ in range(duration):
-                if self.shutdown_requested:
-                    break
-                time.sleep(1)
+            # Wait for the display duration; shutdown() wakes this immediately
+            self._wait_display(duration, next_provider)
 
             return True
 
@@ -233,21 +369,34 @@ class BaseScheduler(ABC):
             print(f"[{self._timestamp()}] Skipping to next provider...")
             print()
             # Brief pause before continuing
-            import time
-            time.sleep(2)
+            self._shutdown_event.wait(timeout=2)
             return False
 
     def shutdown(self):
         """Request graceful shutdown."""
         print()
-        print("=" * 70)
+        print(SEPARATOR)
         print(f"[{self._timestamp()}] Shutdown requested...")
-        print("=" * 70)
-        self.shutdown_requested = True
+        print(SEPARATOR)
+        self._shutdown_event.set()
+        self.close()
+
+    def close(self):
+        """
+        Stop background work: pending prefetches and providers' own workers.
+
+        Safe to call from a signal handler; never waits for in-flight fetches.
+        """
+        self._prefetch_executor.shutdown(cancel_futures=True)
+        for provider in self.providers.values():
+            provider.close()
 
     def _timestamp(self) -> str:
-        """Get current timestamp for logging."""
-        return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        """Get current timestamp for logging, reformatted at most once per second."""
+        second = int(time.time())
+        if second != self._ts_cache[0]:
+            self._ts_cache = (second, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(second)))
+        return self._ts_cache[1]
 
     @abstractmethod
     def run(self):
@@ -4,7 +4,7 @@ Simple rotation scheduler for trix-hub.
 Cycles through configured providers in sequence.
 """
 
-from .base import BaseScheduler
+from .base import BaseScheduler, SEPARATOR
 
 
 class SimpleRotationScheduler(BaseScheduler):
@@ -28,6 +28,13 @@ class SimpleRotationScheduler(BaseScheduler):
         # Get provider rotation order
         self.provider_rotation = self.scheduler_config.get("provider_rotation", [])
 
+        # Rotation config is static, so map provider -> duration override once.
+        # setdefault keeps the first entry's duration if a provider repeats.
+        self._duration_overrides = {}
+        for entry in self.provider_rotation:
+            if "duration" in entry:
+                self._duration_overrides.setdefault(entry.get("name"), entry["duration"])
+
     def _get_provider_list(self):
         """Get list of providers to initialize from rotation config."""
         return self.scheduler_config.get("provider_rotation", [])
@@ -42,10 +49,7 @@ class SimpleRotationScheduler(BaseScheduler):
         Returns:
             Duration in seconds, or None if no override
         """
-        for entry in self.provider_rotation:
-            if entry.get("name") == provider_name and "duration" in entry:
-                return entry["duration"]
-        return None
+        return self._duration_overrides.get(provider_name)
 
     def run(self):
         """
@@ -53,20 +57,20 @@ class SimpleRotationScheduler(BaseScheduler):
 
         Cycles through providers, rendering and posting bitmaps.
         """
-        print("=" * 70)
+        print(SEPARATOR)
         print("trix-hub Simple Rotation Scheduler")
         if self.debug:
             print("*** DEBUG MODE - ASCII Output ***")
         if self.quiet:
             print("*** QUIET MODE - Minimal Logging ***")
-        print("=" * 70)
+        print(SEPARATOR)
         print(f"Mode: {self.scheduler_config.get('mode', 'simple_rotation')}")
         print(f"Default display duration: {self.default_duration}s")
         print(f"Providers in rotation: {', '.join([p.get('name') for p in self.provider_rotation])}")
         if not self.debug:
             print(f"Matrix server: {self.matrix_config.get('server_hostname')}")
         print(f"Display size: {self.matrix_config.get('width')}x{self.matrix_config.get('height')}")
-        print("=" * 70)
+        print(SEPARATOR)
         print()
         print("Starting rotation... (Press Ctrl+C to stop)")
         print()
@@ -74,14 +78,15 @@ class SimpleRotationScheduler(BaseScheduler):
         # Main rotation loop
         rotation_count = 0
 
-        while not self.shutdown_requested:
+        while not self._shutdown_event.is_set():
             rotation_count += 1
 
-            for provider_entry in self.provider_rotation:
-                if self.shutdown_requested:
+            for index, provider_entry in enumerate(self.provider_rotation):
+                if self._shutdown_event.is_set():
                     break
 
                 provider_name = provider_entry.get("name")
+                next_entry = self.provider_rotation[(index + 1) % len(self.provider_rotation)]
 
                 # Get duration override from rotation config
                 duration_override = self._get_provider_duration_override(provider_name)
@@ -89,4 +94,4 @@ class SimpleRotationScheduler(BaseScheduler):
                 # Display provider
                 if not self.quiet:
                     print(f"[{self._timestamp()}] Rotation #{rotation_count} - Provider: {provider_name}")
-                self._display_provider(provider_name, duration_override)
+                self._display_provider(provider_name, duration_override, next_entry.get("name"))
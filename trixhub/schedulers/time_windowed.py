@@ -4,10 +4,9 @@ Time-windowed rotation scheduler for trix-hub.
 Supports different provider rotations for different times of day.
 """
 
-import time
 from datetime import datetime
 from typing import List, Dict, Any, Optional
-from .base import BaseScheduler
+from .base import BaseScheduler, SEPARATOR
 from trixhub.conditions import ConditionEvaluator
 
 
@@ -42,6 +41,14 @@ class TimeWindowedScheduler(BaseScheduler):
         # Call super().__init__() - this will use our rotations
         super().__init__(debug=debug, quiet=quiet)
 
+        # Condition configs are static, so build each rotation's evaluator once
+        # rather than on every check (keyed by id, rotations live as long as we do)
+        self._rotation_evaluators: Dict[int, ConditionEvaluator] = {
+            id(rotation): ConditionEvaluator(rotation["conditions"])
+            for rotation in self.rotations
+            if rotation.get("conditions")
+        }
+
         # Validate rotations
         if not self.rotations:
             print("[Scheduler] Warning: No rotations configured, using fallback rotation only")
@@ -122,32 +129,25 @@ class TimeWindowedScheduler(BaseScheduler):
             # Midnight wraparound (e.g., 21:00-06:00)
             return current_minutes >= start_min or current_minutes < end_min
 
-    def _get_current_minutes(self) -> int:
-        """
-        Get current time in minutes since midnight.
-
-        Returns:
-            Minutes since midnight (0-1439)
-        """
-        now = datetime.now()
-        return now.hour * 60 + now.minute
-
-    def _check_rotation_conditions(self, rotation: Dict[str, Any]) -> bool:
+    def _check_rotation_conditions(self, rotation: Dict[str, Any], now: Optional[datetime] = None) -> bool:
         """
         Check if rotation's conditions are met.
 
         Args:
             rotation: Rotation dict (may contain 'conditions' key)
+            now: Time to evaluate against (default: current local time)
 
         Returns:
             True if conditions pass (or no conditions configured), False otherwise
         """
-        conditions = rotation.get("conditions")
-        if not conditions:
-            return True  # No conditions = always runs
+        evaluator = self._rotation_evaluators.get(id(rotation))
+        if evaluator is None:
+            conditions = rotation.get("conditions")
+            if not conditions:
+                return True  # No conditions = always runs
+            evaluator = ConditionEvaluator(conditions)
 
-        evaluator = ConditionEvaluator(conditions)
-        return evaluator.should_run()
+        return evaluator.should_run(now)
 
     def _get_active_rotation(self) -> Dict[str, Any]:
         """
@@ -159,7 +159,9 @@ class TimeWindowedScheduler(BaseScheduler):
         Returns:
             Rotation dict, or fallback rotation if no match
         """
-        current_minutes = self._get_current_minutes()
+        # One clock read for both the time windows and the conditions
+        now = datetime.now()
+        current_minutes = now.hour * 60 + now.minute
 
         for rotation in self.rotations:
             time_window = rotation.get("time_window", {})
@@ -170,7 +172,7 @@ class TimeWindowedScheduler(BaseScheduler):
                 # Check if time window matches
                 if self._is_time_in_window(current_minutes, start, end):
                     # Check if conditions match
-                    if self._check_rotation_conditions(rotation):
+                    if self._check_rotation_conditions(rotation, now):
                         # Both time and conditions match!
                         return rotation
                     else:
@@ -221,17 +223,15 @@ class TimeWindowedScheduler(BaseScheduler):
             print(f"[{self._timestamp()}] Waiting for next rotation...")
             print()
 
-        while not self.shutdown_requested:
+        while not self._shutdown_event.is_set():
             # Check if we should switch rotation
             if self._should_switch_rotation(rotation_name):
                 print(f"[{self._timestamp()}] Time window changed, switching rotation")
                 break
 
-            # Sleep for 5 seconds
-            for _ in range(5):
-                if self.shutdown_requested:
-                    break
-                time.sleep(1)
+            # Wait 5 seconds (returns early on shutdown)
+            if self._shutdown_event.wait(timeout=5):
+                break
 
     def _run_rotation(self, rotation: Dict[str, Any]):
         """
@@ -247,8 +247,8 @@ class TimeWindowedScheduler(BaseScheduler):
             print(f"[{self._timestamp()}] Warning: Rotation '{rotation_name}' has no providers")
             return
 
-        for provider_entry in providers:
-            if self.shutdown_requested:
+        for index, provider_entry in enumerate(providers):
+            if self._shutdown_event.is_set():
                 break
 
             # Check if we should switch rotation (time window changed)
@@ -258,11 +258,14 @@ class TimeWindowedScheduler(BaseScheduler):
 
             provider_name = provider_entry.get("name")
             duration_override = provider_entry.get("duration")
+            # Wraps to the first provider, since the next cycle usually
+            # stays in the same rotation
+            next_entry = providers[(index + 1) % len(providers)]
 
             # Display provider
             if not self.quiet:
                 print(f"[{self._timestamp()}] Rotation: {rotation_name} - Provider: {provider_name}")
-            self._display_provider(provider_name, duration_override)
+            self._display_provider(provider_name, duration_override, next_entry.get("name"))
 
     def run(self):
         """
@@ -270,20 +273,20 @@ class TimeWindowedScheduler(BaseScheduler):
 
         Switches between rotations based on time windows.
         """
-        print("=" * 70)
+        print(SEPARATOR)
         print("trix-hub Time-Windowed Rotation Scheduler")
         if self.debug:
             print("*** DEBUG MODE - ASCII Output ***")
         if self.quiet:
             print("*** QUIET MODE - Minimal Logging ***")
-        print("=" * 70)
+        print(SEPARATOR)
         print(f"Mode: {self.scheduler_config.get('mode', 'time_windowed_rotation')}")
         print(f"Default display duration: {self.default_duration}s")
         print(f"Rotations configured: {len(self.rotations)}")
         if not self.debug:
             print(f"Matrix server: {self.matrix_config.get('server_hostname')}")
         print(f"Display size: {self.matrix_config.get('width')}x{self.matrix_config.get('height')}")
-        print("=" * 70)
+        print(SEPARATOR)
         print()
         print("Time Windows:")
         for rotation in self.rotations:
@@ -317,7 +320,7 @@ class TimeWindowedScheduler(BaseScheduler):
             else:
                 provider_names = [p.get("name") for p in rotation.get("providers", [])]
                 print(f"  {name}: {start}-{end} -> {', '.join(provider_names)}{condition_desc}")
-        print("=" * 70)
+        print(SEPARATOR)
         print()
         print("Starting scheduler... (Press Ctrl+C to stop)")
         print()
@@ -325,7 +328,7 @@ class TimeWindowedScheduler(BaseScheduler):
         # Main scheduling loop
         cycle_count = 0
 
-        while not self.shutdown_requested:
+        while not self._shutdown_event.is_set():
             cycle_count += 1
 
             # Get active rotation for current time
@@ -4,6 +4,7 @@ Utility functions for trix-hub.
 Helper functions for text rendering and other common operations.
 """
 
+from trixhub.utils.background import DaemonExecutor
 from trixhub.utils.text_helpers import (
     get_text_bbox,
     center_text,
@@ -14,6 +15,7 @@ from trixhub.utils.text_helpers import (
 )
 
 __all__ = [
+    "DaemonExecutor",
     "get_text_bbox",
     "center_text",
     "center_text_x",
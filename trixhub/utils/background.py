@@ -0,0 +1,108 @@
+"""
+Background task execution for trix-hub.
+
+A minimal thread pool whose workers are daemon threads, for work that
+must never hold up process exit (prefetches, speculative downloads).
+concurrent.futures.ThreadPoolExecutor joins its workers at interpreter
+exit, so a slow in-flight task delays shutdown until it finishes.
+"""
+
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, List
+
+
+class DaemonExecutor:
+    """
+    Run callables on a small pool of daemon threads, returning Futures.
+
+    Supports the subset of the Executor API used here: submit() and
+    shutdown(). Tasks still running at exit are abandoned, not joined.
+    """
+
+    __slots__ = ('max_workers', 'thread_name_prefix', '_queue', '_threads',
+                 '_lock', '_shutdown')
+
+    def __init__(self, max_workers: int = 1, thread_name_prefix: str = "worker"):
+        """
+        Initialize executor (worker threads are started on demand).
+
+        Args:
+            max_workers: Maximum number of worker threads
+            thread_name_prefix: Prefix for worker thread names
+        """
+        self.max_workers = max(1, max_workers)
+        self.thread_name_prefix = thread_name_prefix
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._threads: List[threading.Thread] = []
+        self._lock = threading.Lock()
+        self._shutdown = False
+
+    def submit(self, fn: Callable[..., Any], *args, **kwargs) -> Future:
+        """
+        Schedule fn(*args, **kwargs) to run on a worker thread.
+
+        Args:
+            fn: Callable to run
+            *args: Positional arguments for fn
+            **kwargs: Keyword arguments for fn
+
+        Returns:
+            Future for the call's result
+
+        Raises:
+            RuntimeError: If the executor has been shut down
+        """
+        future = Future()
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+            self._queue.put((future, fn, args, kwargs))
+            if len(self._threads) < self.max_workers:
+                thread = threading.Thread(
+                    target=self._worker,
+                    name=f"{self.thread_name_prefix}_{len(self._threads)}",
+                    daemon=True
+                )
+                self._threads.append(thread)
+                thread.start()
+        return future
+
+    def _worker(self) -> None:
+        """Run queued tasks until a stop marker (None) is received."""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+    def shutdown(self, cancel_futures: bool = True) -> None:
+        """
+        Stop accepting tasks and let idle workers exit. Never blocks.
+
+        Args:
+            cancel_futures: If True, cancel tasks that haven't started yet
+        """
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+            if cancel_futures:
+                while True:
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is not None:
+                        item[0].cancel()
+            for _ in self._threads:
+                self._queue.put(None)